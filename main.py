@@ -209,6 +209,8 @@ def main():
         except Exception as e:
             logger.error(f"Error in main loop: {e}", exc_info=True)
             time.sleep(5 * 60)  # Wait 5 minutes on error
+            
+    alpaca.close()
 
 if __name__ == "__main__":
     main()
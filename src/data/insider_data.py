@@ -9,7 +9,7 @@ import logging
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 import time
 import random
 
@@ -212,13 +212,14 @@ class OpenInsiderScraper:
             return None
             
         try:
-            # Get trades from the last 24 hours
+            # Get trades from the last 24 hours (dates are stored as Unix timestamps)
             query = """
             SELECT * FROM insider_trades 
-            WHERE date >= datetime('now', '-1 day')
+            WHERE date >= ?
             """
+            cutoff = int((datetime.now() - timedelta(days=1)).timestamp())
             
-            trades = self.db_manager.execute_query(query)
+            trades = self.db_manager.execute_query(query, (cutoff,))
             if trades:
                 return trades
                 
@@ -242,9 +243,6 @@ class OpenInsiderScraper:
                 # Convert datetime to string if needed
                 if isinstance(trade.get('date'), datetime):
                     trade['date'] = trade['date'].strftime('%Y-%m-%d %H:%M:%S')
-                    
-                # Add creation timestamp
-                trade['created_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 
                 # Insert into database
                 self.db_manager.insert('insider_trades', trade)
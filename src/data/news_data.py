@@ -168,15 +168,17 @@ class NewsSentimentAnalyzer:
         # If we have a database, query it for strong signals
         if self.db_manager:
             try:
+                # Dates are stored as Unix timestamps
                 query = f"""
                 SELECT * FROM news
                 WHERE confidence >= {threshold}
-                AND date >= datetime('now', '-3 day')
+                AND date >= ?
                 ORDER BY confidence DESC
                 LIMIT 50
                 """
+                cutoff = int((datetime.now() - timedelta(days=3)).timestamp())
                 
-                signals = self.db_manager.execute_query(query)
+                signals = self.db_manager.execute_query(query, (cutoff,))
                 if signals:
                     return signals
             except Exception as e:
@@ -610,14 +612,16 @@ class NewsSentimentAnalyzer:
             # Create placeholders for SQL query
             ticker_list = ','.join([f"'{t}'" for t in tickers])
             
+            # Dates are stored as Unix timestamps
             query = f"""
             SELECT * FROM news
             WHERE ticker IN ({ticker_list})
-            AND date >= datetime('now', '-{days_back} day')
+            AND date >= ?
             ORDER BY confidence DESC
             """
+            cutoff = int((datetime.now() - timedelta(days=days_back)).timestamp())
             
-            news_items = self.db_manager.execute_query(query)
+            news_items = self.db_manager.execute_query(query, (cutoff,))
             if not news_items:
                 return None
                 
@@ -650,9 +654,6 @@ class NewsSentimentAnalyzer:
                     # Convert datetime to string if needed
                     if isinstance(item.get('date'), datetime):
                         item['date'] = item['date'].strftime('%Y-%m-%d %H:%M:%S')
-                        
-                    # Add creation timestamp
-                    item['created_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                     
                     # Insert into database
                     self.db_manager.insert('news', item)
@@ -36,9 +36,27 @@ class SignalProcessor:
         self.insider_only_multiplier = config.getfloat('trading', 'insider_only_multiplier', fallback=0.5)
         
         # Read strategy settings from config
+        self._load_strategy_config(config)
+            
+        logger.info(f"Signal Processor initialized with strategies: Insider={self.insider_strategy}, Congress={self.congress_strategy}")
+        
+        # Thresholds for strong signals
+        self.strong_news_threshold = 0.7
+        
+        # Whether to skip trades during FOMC blackout periods
+        self.skip_fomc_blackout = config.getboolean('filters', 'skip_fomc_blackout', fallback=True)
+        
+    def _load_strategy_config(self, config):
+        """
+        Read and validate the insider and congress strategy settings.
+        
+        Args:
+            config (ConfigParser): Configuration object
+        """
         self.insider_strategy = config.get('trading', 'insider_strategy', fallback='inverse').lower()
         self.congress_strategy = config.get('trading', 'congress_strategy', fallback='inverse').lower()
-          # Validate strategy settings
+        
+        # Validate strategy settings
         valid_strategies = ['inverse', 'normal', 'disabled']
         if self.insider_strategy not in valid_strategies:
             logger.warning(f"Invalid insider_strategy '{self.insider_strategy}', defaulting to 'inverse'")
@@ -46,14 +64,6 @@ class SignalProcessor:
         if self.congress_strategy not in valid_strategies:
             logger.warning(f"Invalid congress_strategy '{self.congress_strategy}', defaulting to 'inverse'")
             self.congress_strategy = 'inverse'
-            
-        logger.info(f"Signal Processor initialized with strategies: Insider={self.insider_strategy}, Congress={self.congress_strategy}")
-        
-        # Thresholds for strong signals
-        self.strong_news_threshold = 0.7
-        
-        # Whether to skip trades during FOMC blackout periods
-        self.skip_fomc_blackout = config.getboolean('filters', 'skip_fomc_blackout', fallback=True)
         
     def process_signals(self):
         """
@@ -5,13 +5,330 @@
 Wrapper for the Alpaca API.
 """
 
+import asyncio
 import logging
+import socket
+import threading
 import time
+import uuid
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import islice
 import alpaca_trade_api as tradeapi
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+from alpaca_trade_api.rest import APIError
+from src.utils.api_error_handler import (
+    APIErrorHandler,
+    RateLimiter,
+    RETRYABLE_STATUS_CODES,
+    SERVER_ERROR_STATUS_CODES
+)
+
+try:
+    import orjson
+except ImportError:  # Optional faster JSON decoding
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Shared REST clients keyed by (api_key, base_url) so wrappers reuse one session
+_CLIENT_POOL = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
+# Shared trade update streams, keyed like _CLIENT_POOL so each account has one websocket
+_STREAM_POOL = {}
+_STREAM_POOL_LOCK = threading.Lock()
+
+# Alpaca allows 200 requests/minute per account; every request sent through a
+# pooled session draws from this one bucket
+ALPACA_RATE_LIMITER = RateLimiter(rate=200, per=60)
+
+# Keep-alive pool sizing for the REST session
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+
+# urllib3's defaults already set TCP_NODELAY; add TCP keep-alive so idle pooled
+# connections are not silently dropped between trading cycles
+HTTP_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+]
+
+# Trade update events that end an order's lifecycle
+TERMINAL_ORDER_EVENTS = frozenset({'fill', 'canceled', 'rejected', 'expired'})
+
+# Seconds between status re-checks once the stream has delivered an update for
+# the order being waited on; until then orders are re-checked every ORDER_POLL_INTERVAL
+STREAM_RECHECK_INTERVAL = 15
+ORDER_POLL_INTERVAL = 1
+
+# Recently updated order ids remembered so a waiter registered after the order's
+# first update still counts as tracked by the stream
+STREAM_RECENT_ORDERS = 1000
+
+# Seconds to wait for the stream thread to exit on shutdown
+STREAM_STOP_TIMEOUT = 5
+
+# Option chains fetched ahead of the expiration being checked; kept below the
+# usual number of candidate expirations so an early match skips the rest
+CHAIN_PREFETCH = 2
+
+# Order submissions carry a client_order_id, so retrying 5xx responses
+# cannot place the same order twice
+ORDER_RETRY_STATUS_CODES = RETRYABLE_STATUS_CODES | SERVER_ERROR_STATUS_CODES
+
+# Simulated order returned when the API has no option order endpoint
+MockOrder = namedtuple('MockOrder', ['id', 'status', 'symbol', 'qty', 'filled_qty', 'filled_avg_price'])
+
+class _RateLimitedRetry(Retry):
+    """
+    urllib3 retry policy that counts each retried attempt against ALPACA_RATE_LIMITER.
+    
+    urllib3 repeats requests inside HTTPAdapter.send, so the adapter alone only
+    sees the first attempt and the final response.
+    """
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        # Raises once retries are exhausted; the adapter then sees the final response
+        retry = super().increment(method, url, response=response, error=error, _pool=_pool, _stacktrace=_stacktrace)
+        
+        if response is not None and response.status == 429:
+            ALPACA_RATE_LIMITER.penalize()
+        ALPACA_RATE_LIMITER.acquire()
+        return retry
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """
+    HTTP adapter whose pooled connections use HTTP_SOCKET_OPTIONS and whose
+    requests are counted against ALPACA_RATE_LIMITER.
+    
+    The first attempt is counted here and any retries by _RateLimitedRetry.
+    """
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = HTTP_SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+        
+    def send(self, request, *args, **kwargs):
+        ALPACA_RATE_LIMITER.acquire()
+        response = super().send(request, *args, **kwargs)
+        
+        # Slow the shared bucket down when Alpaca still says we are too fast
+        if response.status_code == 429:
+            ALPACA_RATE_LIMITER.penalize()
+        return response
+
+def _configure_session(api):
+    """
+    Mount a larger keep-alive connection pool with retries on the client session.
+    
+    The retries only cover idempotent requests; urllib3 never retries a POST
+    on an error status, so order submissions are retried by the caller.
+    
+    Args:
+        api (alpaca_trade_api.REST): Alpaca API client
+    """
+    session = getattr(api, '_session', None)
+    if session is None:
+        return
+        
+    # The SDK has its own retry loop (APCA_RETRY_MAX, default 3) around every
+    # request; with the adapter retrying too, attempts and waits multiply, so
+    # the adapter below is the only transport-level retry
+    api._retry = 0
+    
+    retry = _RateLimitedRetry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        raise_on_status=False,
+        respect_retry_after_header=True
+    )
+    adapter = _KeepAliveAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry
+    )
+    session.mount('https://', adapter)
+    
+    # Decode JSON responses with orjson when it is installed
+    if orjson is not None:
+        session.hooks['response'].append(_use_orjson)
+
+# Events for one order waiter: seen once the stream delivers any update for the
+# order, done once it delivers a terminal one
+_OrderWaiter = namedtuple('_OrderWaiter', ['seen', 'done'])
+
+class _TradeUpdateStream:
+    """
+    Trade updates websocket for one account, shared by every wrapper using it.
+    
+    The SDK reconnects silently and exposes no disconnect hook, so the stream is
+    only trusted for an order once it has delivered an update for that order.
+    """
+    
+    def __init__(self, api_key, api_secret, base_url):
+        """
+        Start the stream in a background thread.
+        
+        Args:
+            api_key (str): Alpaca API key
+            api_secret (str): Alpaca API secret
+            base_url (str): Alpaca API base URL
+        """
+        self.stream = tradeapi.Stream(
+            key_id=api_key,
+            secret_key=api_secret,
+            base_url=base_url
+        )
+        self.stream.subscribe_trade_updates(self._on_trade_update)
+        
+        # Number of wrappers using the stream; it is stopped when this drops to zero
+        self.users = 0
+        
+        self._lock = threading.Lock()
+        self._waiters = {}
+        self._recent = OrderedDict()
+        self._listeners = []
+        self._loop = None
+        
+        self._thread = threading.Thread(
+            target=self._run,
+            name="alpaca-trade-updates",
+            daemon=True
+        )
+        self._thread.start()
+        
+    def _run(self):
+        """Run the stream on its own event loop until it is stopped."""
+        # Stream.run() uses the thread's current event loop, which only the main
+        # thread has by default
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self.stream.run()
+        except Exception as e:
+            logger.warning("Alpaca trade updates stream stopped: %s", e)
+        finally:
+            # Nothing will be delivered any more; wake waiters so they poll instead
+            with self._lock:
+                waiters = list(self._waiters.values())
+                self._recent.clear()
+            for waiter in waiters:
+                waiter.seen.clear()
+                waiter.done.set()
+                
+    def add_listener(self, callback):
+        """
+        Call callback(data) for every trade update.
+        
+        Args:
+            callback (callable): Function taking a trade update message
+        """
+        with self._lock:
+            self._listeners.append(callback)
+            
+    def remove_listener(self, callback):
+        """
+        Stop calling a callback added with add_listener.
+        
+        Args:
+            callback (callable): Previously added callback
+        """
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+                
+    def register(self, order_id):
+        """
+        Start waiting on updates for an order.
+        
+        Args:
+            order_id (str): Order ID to wait for
+            
+        Returns:
+            _OrderWaiter: Events set as updates for the order arrive
+        """
+        waiter = _OrderWaiter(threading.Event(), threading.Event())
+        with self._lock:
+            if not self._thread.is_alive():
+                waiter.done.set()
+            elif order_id in self._recent:
+                waiter.seen.set()
+            self._waiters[order_id] = waiter
+        return waiter
+        
+    def unregister(self, order_id):
+        """
+        Stop waiting on updates for an order.
+        
+        Args:
+            order_id (str): Order ID passed to register
+        """
+        with self._lock:
+            self._waiters.pop(order_id, None)
+            
+    def stop(self):
+        """Close the websocket and wait for the stream thread to exit."""
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self.stream.stop_ws(), loop
+                ).result(STREAM_STOP_TIMEOUT)
+            except Exception as e:
+                logger.warning("Error stopping Alpaca trade updates stream: %s", e)
+                
+        self._thread.join(STREAM_STOP_TIMEOUT)
+        if self._thread.is_alive():
+            logger.warning("Alpaca trade updates stream did not stop within %ss", STREAM_STOP_TIMEOUT)
+            
+    async def _on_trade_update(self, data):
+        """
+        Pass a trade update to listeners and wake the waiter for its order.
+        
+        Args:
+            data (alpaca_trade_api.entity.TradeUpdate): Trade update message
+        """
+        order = data.order
+        order_id = order['id'] if isinstance(order, dict) else order.id
+        
+        with self._lock:
+            listeners = list(self._listeners)
+            waiter = self._waiters.get(order_id)
+            self._recent[order_id] = True
+            self._recent.move_to_end(order_id)
+            if len(self._recent) > STREAM_RECENT_ORDERS:
+                self._recent.popitem(last=False)
+                
+        for callback in listeners:
+            try:
+                callback(data)
+            except Exception as e:
+                logger.error("Error in trade update listener: %s", e, exc_info=True)
+                
+        if waiter is None:
+            return
+            
+        waiter.seen.set()
+        if data.event in TERMINAL_ORDER_EVENTS:
+            waiter.done.set()
+
+def _use_orjson(response, *args, **kwargs):
+    """
+    Response hook that makes response.json() decode with orjson.
+    
+    Args:
+        response (requests.Response): HTTP response
+        
+    Returns:
+        requests.Response: The same response with a faster json() method
+    """
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
 class AlpacaWrapper:
     """
     Wrapper for Alpaca API to manage paper trading.
@@ -35,6 +352,14 @@ class AlpacaWrapper:
         # Initialize API
         self.api = self._init_api()
         
+        # Shared trade update stream, attached lazily by wait_for_order
+        self._trade_stream = None
+        self._trade_listeners = []
+        
+        # In-flight option chain fetches shared by concurrent callers
+        self._inflight_chains = {}
+        self._inflight_lock = threading.Lock()
+        
     def _init_api(self):
         """
         Initialize the Alpaca API client.
@@ -47,22 +372,34 @@ class AlpacaWrapper:
                 logger.error("Alpaca API key or secret not provided")
                 return None
                 
-            # Create API client
-            api = tradeapi.REST(
-                key_id=self.api_key,
-                secret_key=self.api_secret,
-                base_url=self.base_url,
-                api_version='v2'
-            )
-            
-            # Test connection
-            account = api.get_account()
-            logger.info(f"Connected to Alpaca API for account {account.id}")
+            # Reuse an existing client for the same credentials
+            pool_key = (self.api_key, self.base_url)
+            api = _CLIENT_POOL.get(pool_key)
+            if api is not None:
+                return api
+                
+            with _CLIENT_POOL_LOCK:
+                api = _CLIENT_POOL.get(pool_key)
+                if api is None:
+                    # Create API client
+                    api = tradeapi.REST(
+                        key_id=self.api_key,
+                        secret_key=self.api_secret,
+                        base_url=self.base_url,
+                        api_version='v2'
+                    )
+                    _configure_session(api)
+                    
+                    # Test connection
+                    account = api.get_account()
+                    logger.info("Connected to Alpaca API for account %s", account.id)
+                    
+                    _CLIENT_POOL[pool_key] = api
             
             return api
             
         except Exception as e:
-            logger.error(f"Error initializing Alpaca API: {e}", exc_info=True)
+            logger.error("Error initializing Alpaca API: %s", e, exc_info=True)
             return None
             
     def get_account(self):
@@ -80,7 +417,7 @@ class AlpacaWrapper:
             return self.api.get_account()
             
         except Exception as e:
-            logger.error(f"Error getting account: {e}", exc_info=True)
+            logger.error("Error getting account: %s", e, exc_info=True)
             return None
             
     def get_positions(self):
@@ -98,7 +435,7 @@ class AlpacaWrapper:
             return self.api.list_positions()
             
         except Exception as e:
-            logger.error(f"Error getting positions: {e}", exc_info=True)
+            logger.error("Error getting positions: %s", e, exc_info=True)
             return []
     
     def get_orders(self, status=None, symbols=None, limit=50):
@@ -135,7 +472,7 @@ class AlpacaWrapper:
             return orders
             
         except Exception as e:
-            logger.error(f"Error getting orders: {e}", exc_info=True)
+            logger.error("Error getting orders: %s", e, exc_info=True)
             return []
             
     def get_last_price(self, symbol):
@@ -162,7 +499,7 @@ class AlpacaWrapper:
             return None
             
         except Exception as e:
-            logger.error(f"Error getting last price for {symbol}: {e}", exc_info=True)
+            logger.error("Error getting last price for %s: %s", symbol, e, exc_info=True)
             return None
             
     def is_market_open(self):
@@ -181,7 +518,7 @@ class AlpacaWrapper:
             return clock.is_open
             
         except Exception as e:
-            logger.error(f"Error checking if market is open: {e}", exc_info=True)
+            logger.error("Error checking if market is open: %s", e, exc_info=True)
             return False
             
     def _handle_short_selling(self, symbol, qty, side):
@@ -206,24 +543,24 @@ class AlpacaWrapper:
                 # If position exists, check if qty is greater than position
                 current_qty = float(position.qty)
                 if current_qty < qty:
-                    logger.warning(f"Reducing sell order for {symbol} from {qty} to {current_qty} to avoid short selling")
+                    logger.warning("Reducing sell order for %s from %s to %s to avoid short selling", symbol, qty, current_qty)
                     qty = current_qty
             except Exception:
                 # No position exists, this would be a short sell
-                logger.warning(f"Short selling attempted for {symbol}. Checking if allowed...")
+                logger.warning("Short selling attempted for %s. Checking if allowed...", symbol)
                 
                 # Check if short selling is allowed for this symbol
                 try:
                     asset = self.api.get_asset(symbol)
                     if not getattr(asset, 'shortable', False):
-                        logger.warning(f"Short selling not allowed for {symbol}, converting to buy order")
+                        logger.warning("Short selling not allowed for %s, converting to buy order", symbol)
                         side = 'buy'  # Convert to buy instead
                 except Exception as se:
-                    logger.error(f"Error checking if {symbol} is shortable: {se}")
+                    logger.error("Error checking if %s is shortable: %s", symbol, se)
                     # Default to safer option - convert to buy
                     side = 'buy'
         except Exception as e:
-            logger.error(f"Error handling short selling for {symbol}: {e}")
+            logger.error("Error handling short selling for %s: %s", symbol, e)
             # Default to safer option - convert to buy
             side = 'buy'
             
@@ -251,39 +588,61 @@ class AlpacaWrapper:
             side, qty = self._handle_short_selling(symbol, qty, side)
             
             # Submit order with potentially modified parameters
-            order = self.api.submit_order(
-                symbol=symbol,
-                qty=qty,
-                side=side,
-                type=type,
-                time_in_force=time_in_force
-            )
+            order = self._submit_with_retry(symbol, qty, side, type, time_in_force)
             
-            logger.info(f"Submitted {side} order for {qty} shares of {symbol}")
+            logger.info("Submitted %s order for %s shares of %s", side, qty, symbol)
             return order
             
         except Exception as e:
-            logger.error(f"Error submitting order for {symbol}: {e}", exc_info=True)
+            logger.error("Error submitting order for %s: %s", symbol, e, exc_info=True)
             
             # If the error is specifically about short selling, convert to a buy order
             if "not allowed to short" in str(e).lower():
-                logger.warning(f"Short selling not allowed for {symbol}, attempting to submit buy order instead")
+                logger.warning("Short selling not allowed for %s, attempting to submit buy order instead", symbol)
                 try:
                     # Retry as a buy order
-                    order = self.api.submit_order(
-                        symbol=symbol,
-                        qty=qty,
-                        side='buy',  # Convert to buy
-                        type=type,
-                        time_in_force=time_in_force
-                    )
-                    logger.info(f"Converted to buy order for {qty} shares of {symbol}")
+                    order = self._submit_with_retry(symbol, qty, 'buy', type, time_in_force)
+                    logger.info("Converted to buy order for %s shares of %s", qty, symbol)
                     return order
                 except Exception as retry_e:
-                    logger.error(f"Error submitting converted buy order for {symbol}: {retry_e}", exc_info=True)
+                    logger.error("Error submitting converted buy order for %s: %s", symbol, retry_e, exc_info=True)
             
             return None
             
+    def _submit_with_retry(self, symbol, qty, side, type, time_in_force):
+        """
+        Submit one order, retrying rate-limited and server errors with backoff.
+        
+        Args:
+            symbol (str): Symbol to trade
+            qty (int): Quantity to trade
+            side (str): 'buy' or 'sell'
+            type (str): 'market', 'limit', etc.
+            time_in_force (str): 'day', 'gtc', etc.
+            
+        Returns:
+            alpaca_trade_api.entity.Order: Order object
+        """
+        # Every attempt reuses the same client_order_id, so a retry after a 5xx
+        # that actually reached Alpaca is rejected instead of placing a duplicate
+        client_order_id = uuid.uuid4().hex
+        try:
+            return APIErrorHandler.retry_with_backoff(lambda: self.api.submit_order(
+                symbol=symbol,
+                qty=qty,
+                side=side,
+                type=type,
+                time_in_force=time_in_force,
+                client_order_id=client_order_id
+            ), retry_statuses=ORDER_RETRY_STATUS_CODES)
+        except APIError as e:
+            if APIErrorHandler.get_status_code(e) != 422 or 'client_order_id' not in str(e):
+                raise
+                
+            # A retried attempt collided with one that reached Alpaca before failing
+            logger.warning("Order for %s was already accepted, fetching it by client_order_id", symbol)
+            return self.api.get_order_by_client_order_id(client_order_id)
+            
     def wait_for_order(self, order_id, timeout=60):
         """
         Wait for an order to be filled.
@@ -300,30 +659,120 @@ class AlpacaWrapper:
                 logger.error("Alpaca API not initialized")
                 return None
                 
-            # Wait for order to be filled
-            start_time = time.time()
-            
-            while time.time() - start_time < timeout:
-                order = self.api.get_order(order_id)
+            # Register the waiter before checking status so no update is missed
+            stream = self._ensure_trade_stream()
+            waiter = stream.register(order_id) if stream else None
                 
-                if order.status == 'filled':
-                    logger.info(f"Order {order_id} filled")
-                    return order
-                    
-                elif order.status == 'rejected' or order.status == 'canceled':
-                    logger.error(f"Order {order_id} {order.status}")
-                    return order
+            try:
+                start_time = time.time()
+                
+                while True:
+                    order = self.api.get_order(order_id)
                     
-                # Wait 1 second before checking again
-                time.sleep(1)
+                    if order.status == 'filled':
+                        logger.info("Order %s filled", order_id)
+                        return order
+                        
+                    elif order.status == 'rejected' or order.status == 'canceled':
+                        logger.error("Order %s %s", order_id, order.status)
+                        return order
+                        
+                    remaining = timeout - (time.time() - start_time)
+                    if remaining <= 0:
+                        break
+                        
+                    if waiter is not None and not waiter.done.is_set():
+                        # Only rely on the stream for long waits once it has delivered an
+                        # update for this order; until then keep polling
+                        interval = STREAM_RECHECK_INTERVAL if waiter.seen.is_set() else ORDER_POLL_INTERVAL
+                        waiter.done.wait(min(remaining, interval))
+                    else:
+                        # Wait 1 second before checking again
+                        time.sleep(min(remaining, ORDER_POLL_INTERVAL))
+            finally:
+                if stream:
+                    stream.unregister(order_id)
                 
-            logger.warning(f"Timeout waiting for order {order_id}")
+            logger.warning("Timeout waiting for order %s", order_id)
             return None
             
         except Exception as e:
-            logger.error(f"Error waiting for order {order_id}: {e}", exc_info=True)
+            logger.error("Error waiting for order %s: %s", order_id, e, exc_info=True)
             return None
             
+    def _ensure_trade_stream(self):
+        """
+        Attach to the account's shared trade updates stream, starting it if needed.
+        
+        The stream thread starting does not mean it connected; wait_for_order
+        keeps polling at ORDER_POLL_INTERVAL until an update for the order arrives.
+        
+        Returns:
+            _TradeUpdateStream: The shared stream, or None to fall back to polling
+        """
+        if self._trade_stream is not None:
+            return self._trade_stream
+            
+        with _STREAM_POOL_LOCK:
+            if self._trade_stream is not None:
+                return self._trade_stream
+                
+            pool_key = (self.api_key, self.base_url)
+            stream = _STREAM_POOL.get(pool_key)
+            if stream is None:
+                try:
+                    stream = _TradeUpdateStream(self.api_key, self.api_secret, self.base_url)
+                except Exception as e:
+                    logger.warning("Trade updates stream unavailable, polling orders instead: %s", e)
+                    return None
+                    
+                _STREAM_POOL[pool_key] = stream
+                logger.info("Started Alpaca trade updates stream")
+                
+            stream.users += 1
+            self._trade_stream = stream
+            return stream
+            
+    def add_trade_update_listener(self, callback):
+        """
+        Call callback(data) for every trade update on this account.
+        
+        Args:
+            callback (callable): Function taking a trade update message
+            
+        Returns:
+            bool: True if registered, False if the stream is unavailable
+        """
+        stream = self._ensure_trade_stream()
+        if stream is None:
+            return False
+            
+        stream.add_listener(callback)
+        self._trade_listeners.append(callback)
+        return True
+        
+    def close(self):
+        """Detach from the shared trade updates stream, stopping it once no wrapper uses it."""
+        with _STREAM_POOL_LOCK:
+            stream, self._trade_stream = self._trade_stream, None
+            if stream is None:
+                return
+                
+            for callback in self._trade_listeners:
+                stream.remove_listener(callback)
+            self._trade_listeners = []
+            
+            stream.users -= 1
+            if stream.users > 0:
+                return
+                
+            pool_key = (self.api_key, self.base_url)
+            if _STREAM_POOL.get(pool_key) is stream:
+                del _STREAM_POOL[pool_key]
+                
+        stream.stop()
+        logger.info("Stopped Alpaca trade updates stream")
+            
     def get_bars(self, symbol, timeframe='1D', start=None, end=None, limit=None):
         """
         Get bars for a symbol.
@@ -365,13 +814,48 @@ class AlpacaWrapper:
             return bars
             
         except Exception as e:
-            logger.error(f"Error getting bars for {symbol}: {e}", exc_info=True)
+            logger.error("Error getting bars for %s: %s", symbol, e, exc_info=True)
             return []
         
     def get_option_chain(self, symbol, expiration_date=None):
         """
         Get an option chain for a given symbol.
         
+        Concurrent calls for the same symbol and expiration share a single fetch.
+        
+        Args:
+            symbol (str): Stock ticker symbol
+            expiration_date (str): Optional expiration date in YYYY-MM-DD format
+            
+        Returns:
+            dict: Dictionary containing option chain data or None if error
+        """
+        key = (symbol, expiration_date)
+        
+        with self._inflight_lock:
+            future = self._inflight_chains.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight_chains[key] = future
+                
+        if not owner:
+            return future.result()
+            
+        try:
+            chain = self._fetch_option_chain(symbol, expiration_date)
+            future.set_result(chain)
+            return chain
+        finally:
+            if not future.done():
+                future.set_result(None)
+            with self._inflight_lock:
+                self._inflight_chains.pop(key, None)
+    
+    def _fetch_option_chain(self, symbol, expiration_date=None):
+        """
+        Fetch an option chain for a given symbol.
+        
         Args:
             symbol (str): Stock ticker symbol
             expiration_date (str): Optional expiration date in YYYY-MM-DD format
@@ -386,7 +870,7 @@ class AlpacaWrapper:
                 
             # Check if symbol exists
             if not self._check_symbol_exists(symbol):
-                logger.error(f"Symbol {symbol} not found")
+                logger.error("Symbol %s not found", symbol)
                 return None
             
             # Get available expirations if not provided
@@ -409,10 +893,10 @@ class AlpacaWrapper:
                     expiration_date = fridays[2] if len(fridays) >= 3 else fridays[0]
                     
                 except Exception as e:
-                    logger.error(f"Error calculating expiration dates: {e}", exc_info=True)
+                    logger.error("Error calculating expiration dates: %s", e, exc_info=True)
                     expiration_date = (today + timedelta(days=30)).strftime('%Y-%m-%d')
             
-            logger.info(f"Getting option chain for {symbol} with expiration {expiration_date}")
+            logger.info("Getting option chain for %s with expiration %s", symbol, expiration_date)
             
             # In a real implementation, we would call the API:
             # options = self.api.get_option_chain(symbol, expiration_date)
@@ -432,13 +916,18 @@ class AlpacaWrapper:
             calls = []
             puts = []
             
+            # OCC symbol prefixes are the same for every strike
+            exp_compact = expiration_date.replace('-', '')
+            call_prefix = f"{symbol}C{exp_compact}00"
+            put_prefix = f"{symbol}P{exp_compact}00"
+            
             for strike in strikes:
                 # Simulate call option
                 call_price = max(0.05, round(current_price - strike + 2, 2)) if current_price > strike else round(0.05 + (current_price / strike) * 2, 2)
                 call_volume = int(1000 * (1 - abs(current_price - strike) / current_price)) if abs(current_price - strike) / current_price < 0.9 else 10
                 
                 calls.append({
-                    'symbol': f"{symbol}C{expiration_date.replace('-', '')}00{int(strike)}000",
+                    'symbol': f"{call_prefix}{int(strike)}000",
                     'strike': strike,
                     'last_price': call_price,
                     'bid': round(call_price * 0.95, 2),
@@ -454,7 +943,7 @@ class AlpacaWrapper:
                 put_volume = int(1000 * (1 - abs(current_price - strike) / current_price)) if abs(current_price - strike) / current_price < 0.9 else 10
                 
                 puts.append({
-                    'symbol': f"{symbol}P{expiration_date.replace('-', '')}00{int(strike)}000",
+                    'symbol': f"{put_prefix}{int(strike)}000",
                     'strike': strike,
                     'last_price': put_price,
                     'bid': round(put_price * 0.95, 2),
@@ -475,7 +964,7 @@ class AlpacaWrapper:
             }
             
         except Exception as e:
-            logger.error(f"Error getting option chain for {symbol}: {e}", exc_info=True)
+            logger.error("Error getting option chain for %s: %s", symbol, e, exc_info=True)
             return None
     
     def submit_option_order(self, option_symbol, qty, side, type, time_in_force):
@@ -508,17 +997,13 @@ class AlpacaWrapper:
                     type=type,
                     time_in_force=time_in_force
                 )
-                logger.info(f"Submitted {side} option order for {qty} contracts of {option_symbol}")
+                logger.info("Submitted %s option order for %s contracts of %s", side, qty, option_symbol)
                 return order
             except AttributeError:
                 # If the method doesn't exist, create a simulated order
                 logger.warning("Option trading not directly supported, creating simulated order")
                 
                 # Create a simulated order object (for testing/education only)
-                import uuid
-                from collections import namedtuple
-                
-                MockOrder = namedtuple('MockOrder', ['id', 'status', 'symbol', 'qty', 'filled_qty', 'filled_avg_price'])
                 order_id = str(uuid.uuid4())
                 
                 # Simulate a filled order with a price based on the symbol
@@ -533,11 +1018,11 @@ class AlpacaWrapper:
                     filled_avg_price=mock_price
                 )
                 
-                logger.info(f"Created simulated option order {order_id} for {option_symbol}")
+                logger.info("Created simulated option order %s for %s", order_id, option_symbol)
                 return order
                 
         except Exception as e:
-            logger.error(f"Error submitting option order for {option_symbol}: {e}", exc_info=True)
+            logger.error("Error submitting option order for %s: %s", option_symbol, e, exc_info=True)
             return None
     def get_option_positions(self):
         """
@@ -559,10 +1044,10 @@ class AlpacaWrapper:
             return []
             
         except Exception as e:
-            logger.error(f"Error getting option positions: {e}", exc_info=True)
+            logger.error("Error getting option positions: %s", e, exc_info=True)
             return []
             
-    def find_option_contract(self, symbol, target_delta, right, days_to_expiry=30, max_days_range=15):
+    def find_option_contract(self, symbol, target_delta, right, days_to_expiry=30, max_days_range=15, delta_tolerance=0.02):
         """
         Find an options contract with a target delta and days to expiry.
         
@@ -572,6 +1057,7 @@ class AlpacaWrapper:
             right (str): 'call' or 'put'
             days_to_expiry (int): Target number of days to expiry
             max_days_range (int): Maximum range of days around target expiry to consider
+            delta_tolerance (float): Stop searching once a contract is this close to the target delta
             
         Returns:
             dict: Selected option contract details or None if none found
@@ -583,17 +1069,17 @@ class AlpacaWrapper:
             try:
                 asset = self.api.get_asset(symbol)
                 if not asset.tradable or not getattr(asset, 'fractionable', True):  # Options typically require marginable stocks
-                    logger.warning(f"{symbol} is not tradable for options")
+                    logger.warning("%s is not tradable for options", symbol)
                     return self._get_sample_option_contract(symbol, right, target_delta, days_to_expiry)
             except Exception as e:
-                logger.warning(f"Error checking if {symbol} is tradable: {e}")
+                logger.warning("Error checking if %s is tradable: %s", symbol, e)
                 # Continue anyway - we'll try to get the chain and fallback if needed
                 
             # Calculate target expiration date
             today = datetime.now().date()
             target_date = today + timedelta(days=days_to_expiry)
             
-            logger.info(f"Finding {right} option for {symbol} with delta ~{target_delta} and ~{days_to_expiry} days to expiry")
+            logger.info("Finding %s option for %s with delta ~%s and ~%s days to expiry", right, symbol, target_delta, days_to_expiry)
             
             # Get available expirations (we'll use simulated data for now)
             expirations = []
@@ -604,54 +1090,85 @@ class AlpacaWrapper:
                     expirations.append(exp_date.strftime('%Y-%m-%d'))
             
             if not expirations:
-                logger.warning(f"No valid expiration dates found for {symbol}")
+                logger.warning("No valid expiration dates found for %s", symbol)
                 return None
                 
             # Sort by distance to target days
             expirations.sort(key=lambda x: abs((datetime.strptime(x, '%Y-%m-%d').date() - today).days - days_to_expiry))
             
-            # Try each expiration date in order of preference
-            for expiration_date in expirations:
-                # Get option chain for this expiration
-                chain = self.get_option_chain(symbol, expiration_date)
-                if not chain:
-                    continue
+            # Look for the option with delta closest to target
+            # For puts, delta is negative, so we use absolute value for comparison
+            target_delta_abs = abs(target_delta)
+            best_match = None
+            best_distance = None
+            best_expiration = None
+            best_chain = None
+            
+            # Fetch a few chains ahead of the one being checked, so an early
+            # match leaves at most CHAIN_PREFETCH - 1 requests behind
+            executor = ThreadPoolExecutor(max_workers=min(CHAIN_PREFETCH, len(expirations)))
+            upcoming = iter(expirations)
+            chain_futures = deque(
+                (expiration_date, executor.submit(self.get_option_chain, symbol, expiration_date))
+                for expiration_date in islice(upcoming, CHAIN_PREFETCH)
+            )
+            
+            try:
+                while chain_futures:
+                    expiration_date, chain_future = chain_futures.popleft()
+                    chain = chain_future.result()
                     
-                # Get the options list based on right (call or put)
-                options_list = chain['calls'] if right.lower() == 'call' else chain['puts']
-                
-                if not options_list:
-                    continue
-                
-                # Look for the option with delta closest to target
-                # For puts, delta is negative, so we use absolute value for comparison
-                target_delta_abs = abs(target_delta)
-                options_list.sort(key=lambda x: abs(abs(x['delta']) - target_delta_abs))
-                
-                # Check if we have a suitable option
-                if options_list:
-                    best_match = options_list[0]
+                    # Get the options list based on right (call or put)
+                    options_list = None
+                    if chain:
+                        options_list = chain['calls'] if right.lower() == 'call' else chain['puts']
+                    
+                    if options_list:
+                        candidate = min(options_list, key=lambda x: abs(abs(x['delta']) - target_delta_abs))
+                        distance = abs(abs(candidate['delta']) - target_delta_abs)
+                        
+                        # Keep the best match seen so far, preferring earlier expirations on ties
+                        if best_match is None or distance < best_distance:
+                            best_match = candidate
+                            best_distance = distance
+                            best_expiration = expiration_date
+                            best_chain = chain
+                        
+                        # Stop once a match is close enough to the target delta
+                        if best_distance <= delta_tolerance:
+                            break
                     
-                    # Calculate option's price as the midpoint of bid and ask
-                    price = (best_match['bid'] + best_match['ask']) / 2
+                    # Keep the window full with the next expiration in line
+                    for next_date in islice(upcoming, 1):
+                        chain_futures.append((next_date, executor.submit(self.get_option_chain, symbol, next_date)))
+            finally:
+                # Leave any lookahead fetches behind instead of waiting for them
+                for _, pending in chain_futures:
+                    pending.cancel()
+                executor.shutdown(wait=False)
                     
-                    # Return the contract with price included
-                    return {
-                        'symbol': best_match['symbol'],
-                        'strike': best_match['strike'],
-                        'price': price,
-                        'delta': best_match['delta'],
-                        'expiration_date': expiration_date,
-                        'days_to_expiry': (datetime.strptime(expiration_date, '%Y-%m-%d').date() - today).days,
-                        'right': right,
-                        'underlying_price': chain['underlying_price']
-                    }
-            logger.warning(f"No suitable {right} option found for {symbol} with delta ~{target_delta}")
+            if best_match:
+                # Calculate option's price as the midpoint of bid and ask
+                price = (best_match['bid'] + best_match['ask']) / 2
+                
+                # Return the contract with price included
+                return {
+                    'symbol': best_match['symbol'],
+                    'strike': best_match['strike'],
+                    'price': price,
+                    'delta': best_match['delta'],
+                    'expiration_date': best_expiration,
+                    'days_to_expiry': (datetime.strptime(best_expiration, '%Y-%m-%d').date() - today).days,
+                    'right': right,
+                    'underlying_price': best_chain['underlying_price']
+                }
+                
+            logger.warning("No suitable %s option found for %s with delta ~%s", right, symbol, target_delta)
             # Use sample data as a fallback when no suitable options found
             return self._get_sample_option_contract(symbol, right, target_delta, days_to_expiry)
             
         except Exception as e:
-            logger.error(f"Error finding option contract for {symbol}: {e}", exc_info=True)
+            logger.error("Error finding option contract for %s: %s", symbol, e, exc_info=True)
             # Use sample data as a fallback when an error occurs
             return self._get_sample_option_contract(symbol, right, target_delta, days_to_expiry)
     
@@ -675,22 +1192,22 @@ class AlpacaWrapper:
             
             # Check if the asset is tradable
             if not asset.tradable:
-                logger.warning(f"Symbol {symbol} exists but is not tradable")
+                logger.warning("Symbol %s exists but is not tradable", symbol)
                 return False
                 
             # Check if it's a valid equity (not crypto, etc.)
             if hasattr(asset, 'asset_class') and asset.asset_class != 'us_equity':
-                logger.warning(f"Symbol {symbol} is not a US equity (class: {asset.asset_class})")
+                logger.warning("Symbol %s is not a US equity (class: %s)", symbol, asset.asset_class)
                 return False
             elif hasattr(asset, 'class_') and asset.class_ != 'us_equity':
-                logger.warning(f"Symbol {symbol} is not a US equity (class: {asset.class_})")
+                logger.warning("Symbol %s is not a US equity (class: %s)", symbol, asset.class_)
                 return False
                 
-            logger.debug(f"Symbol {symbol} is valid and tradable")
+            logger.debug("Symbol %s is valid and tradable", symbol)
             return True
             
         except Exception as e:
-            logger.warning(f"Symbol {symbol} not found or not accessible: {e}")
+            logger.warning("Symbol %s not found or not accessible: %s", symbol, e)
             return False
     
     def validate_symbol(self, symbol):
@@ -719,9 +1236,7 @@ class AlpacaWrapper:
         Returns:
             dict: Simulated option contract
         """
-        import random
-        
-        logger.warning(f"Using simulated option contract for {symbol} {right}")
+        logger.warning("Using simulated option contract for %s %s", symbol, right)
         
         # Get the current price or use a placeholder
         current_price = self.get_last_price(symbol) or 100
@@ -768,5 +1283,5 @@ class AlpacaWrapper:
             'open_interest': 500
         }
         
-        logger.info(f"Generated sample {right} option contract for {symbol} with delta {target_delta}")
+        logger.info("Generated sample %s option contract for %s with delta %s", right, symbol, target_delta)
         return contract
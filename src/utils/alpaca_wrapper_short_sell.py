@@ -3,7 +3,154 @@ This file contains a function to enhance the AlpacaWrapper class to handle short
 You can incorporate these methods into your AlpacaWrapper class.
 """
 
-def handle_short_selling(self, symbol, qty, side, type, time_in_force):
+import logging
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from alpaca_trade_api.rest import APIError
+from src.utils.api_error_handler import APIErrorHandler
+
+logger = logging.getLogger(__name__)
+
+# Number of order submission workers; each symbol always maps to the same one
+ORDER_WORKERS = 8
+
+# Error message Alpaca returns when an order would open a disallowed short
+SHORT_SELL_RE = re.compile(r'not allowed to short', re.IGNORECASE)
+
+class PositionCache:
+    """
+    Short-lived in-memory cache of position quantities keyed by symbol.
+    
+    A single list_positions() call refreshes every symbol at once, so sell
+    orders no longer need a get_position() round trip each.
+    """
+    
+    def __init__(self, api, ttl=1.0):
+        """
+        Initialize the position cache.
+        
+        Args:
+            api (alpaca_trade_api.REST): Alpaca API client
+            ttl (float): Seconds before the cached positions are refreshed
+        """
+        self.api = api
+        self.ttl = ttl
+        self._positions = {}
+        self._last_refresh = None
+        self._refresh = None
+        self._lock = threading.Lock()
+        
+    def get(self, symbol):
+        """
+        Get the current position quantity for a symbol.
+        
+        Args:
+            symbol (str): Symbol to look up
+            
+        Returns:
+            float: Position quantity or None if there is no position
+        """
+        return self._current().get(symbol)
+        
+    def snapshot(self):
+        """
+        Get a copy of every position quantity that later updates will not change.
+        
+        Returns:
+            dict: Position quantities keyed by symbol
+        """
+        positions = self._current()
+        with self._lock:
+            return dict(positions)
+            
+    def _current(self):
+        """
+        Get the live positions dict, refreshing it first if it is stale.
+        
+        Returns:
+            dict: Position quantities keyed by symbol
+        """
+        with self._lock:
+            if self._last_refresh is not None and time.monotonic() - self._last_refresh <= self.ttl:
+                return self._positions
+                
+            # Concurrent callers share one in-flight refresh instead of each hitting the API
+            refresh = self._refresh
+            owner = refresh is None
+            if owner:
+                refresh = self._refresh = Future()
+                
+        if owner:
+            try:
+                positions = {p.symbol: float(p.qty) for p in self.api.list_positions()}
+            except Exception as e:
+                with self._lock:
+                    self._refresh = None
+                refresh.set_exception(e)
+                raise
+                
+            with self._lock:
+                self._positions = positions
+                self._last_refresh = time.monotonic()
+                self._refresh = None
+            refresh.set_result(positions)
+            
+        return refresh.result()
+            
+    def invalidate(self):
+        """Force the next lookup to refresh from the API."""
+        with self._lock:
+            self._last_refresh = None
+            
+    def apply_trade_update(self, data):
+        """
+        Update the cache from a trade updates stream message.
+        
+        Args:
+            data (alpaca_trade_api.entity.TradeUpdate): Trade update message
+        """
+        if data.event not in ('fill', 'partial_fill', 'canceled'):
+            return
+            
+        order = data.order
+        symbol = order['symbol'] if isinstance(order, dict) else order.symbol
+        position_qty = getattr(data, 'position_qty', None)
+        
+        if position_qty is None:
+            self.invalidate()
+            return
+            
+        with self._lock:
+            qty = float(position_qty)
+            if qty:
+                self._positions[symbol] = qty
+            else:
+                self._positions.pop(symbol, None)
+
+_POSITION_CACHE_LOCK = threading.Lock()
+_ORDER_WORKERS_LOCK = threading.Lock()
+
+def get_position_cache(self):
+    """
+    Get the position cache for this wrapper, creating it on first use.
+    
+    Returns:
+        PositionCache: Position cache bound to self.api
+    """
+    cache = getattr(self, '_position_cache', None)
+    if cache is None:
+        with _POSITION_CACHE_LOCK:
+            cache = getattr(self, '_position_cache', None)
+            if cache is None:
+                cache = PositionCache(self.api)
+                # Keep cached positions in step with fills
+                self.add_trade_update_listener(cache.apply_trade_update)
+                self._position_cache = cache
+    return cache
+
+def handle_short_selling(self, symbol, qty, side, type, time_in_force, positions=None):
     """
     Handle short selling restrictions for order submission.
     
@@ -13,30 +160,80 @@ def handle_short_selling(self, symbol, qty, side, type, time_in_force):
         side (str): 'buy' or 'sell'
         type (str): 'market', 'limit', etc.
         time_in_force (str): 'day', 'gtc', etc.
+        positions (dict): Optional position quantities keyed by symbol to
+            check against instead of the position cache
         
     Returns:
         tuple: Modified (side, qty) parameters
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     # Only check sells for short selling issues
     if side.lower() == 'sell':
-        # Check current position first to determine if it's a short sell
-        try:
-            position = self.api.get_position(symbol)
-            # If position exists, check if qty is greater than position
-            current_qty = float(position.qty)
-            if current_qty < qty:
-                logger.warning(f"Reducing sell order for {symbol} from {qty} to {current_qty} to avoid short selling")
-                qty = current_qty
-        except Exception:
-            # No position exists, this would be a short sell
-            logger.warning(f"Short selling attempted for {symbol}. Converting to buy order...")
+        # Check current position first to determine if it's a short sell. A
+        # missing symbol is simply absent from list_positions(), so any error
+        # here is a real failure and must not turn the sell into a buy
+        if positions is None:
+            current_qty = get_position_cache(self).get(symbol)
+        else:
+            current_qty = positions.get(symbol)
+            
+        if current_qty is None or current_qty <= 0:
+            # No long position exists, this would be a short sell
+            logger.warning("Short selling attempted for %s. Converting to buy order...", symbol)
             side = 'buy'  # Convert to buy instead to avoid short selling restrictions
+        elif current_qty < qty:
+            # If position exists, check if qty is greater than position
+            logger.warning("Reducing sell order for %s from %s to %s to avoid short selling", symbol, qty, current_qty)
+            qty = current_qty
     
     return side, qty
 
+def handle_short_selling_batch(self, orders):
+    """
+    Handle short selling restrictions for a list of orders with one positions lookup.
+    
+    Args:
+        orders (list): Order dictionaries with 'symbol', 'qty' and 'side' keys,
+            plus optional 'type' and 'time_in_force'
+        
+    Returns:
+        list: The same orders with 'side' and 'qty' adjusted in place
+    """
+    # Take one fresh positions snapshot and check every order against it, so
+    # the cache expiring partway through cannot mix two different snapshots
+    cache = get_position_cache(self)
+    cache.invalidate()
+    positions = cache.snapshot()
+    
+    for order in orders:
+        order['side'], order['qty'] = self.handle_short_selling(
+            order['symbol'],
+            order['qty'],
+            order['side'],
+            order.get('type'),
+            order.get('time_in_force'),
+            positions=positions
+        )
+    
+    return orders
+
+def _do_submit(self, symbol, qty, side, type, time_in_force):
+    """
+    Submit one order, retrying rate-limited and server errors with backoff.
+    
+    Args:
+        symbol (str): Symbol to trade
+        qty (int): Quantity to trade
+        side (str): 'buy' or 'sell'
+        type (str): 'market', 'limit', etc.
+        time_in_force (str): 'day', 'gtc', etc.
+        
+    Returns:
+        alpaca_trade_api.entity.Order: Order object
+    """
+    # Shares the wrapper's client_order_id handling, so both submit paths
+    # retry 5xx responses without risking a duplicate order
+    return self._submit_with_retry(symbol, qty, side, type, time_in_force)
+
 def submit_order_with_short_check(self, symbol, qty, side, type, time_in_force):
     """
     Submit an order with short selling protection.
@@ -51,47 +248,85 @@ def submit_order_with_short_check(self, symbol, qty, side, type, time_in_force):
     Returns:
         alpaca_trade_api.entity.Order: Order object or None if error
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     try:
         if not self.api:
             logger.error("Alpaca API not initialized")
             return None
         
-        # Handle short selling restrictions
+        # Handle short selling restrictions; with the position cache warm this
+        # decides the side up front, so the order goes out in one request
         side, qty = self.handle_short_selling(symbol, qty, side, type, time_in_force)
         
         # Submit order with potentially modified parameters
-        order = self.api.submit_order(
-            symbol=symbol,
-            qty=qty,
-            side=side,
-            type=type,
-            time_in_force=time_in_force
-        )
+        order = _do_submit(self, symbol, qty, side, type, time_in_force)
         
-        logger.info(f"Submitted {side} order for {qty} shares of {symbol}")
+        logger.info("Submitted %s order for %s shares of %s", side, qty, symbol)
         return order
         
-    except Exception as e:
-        logger.error(f"Error submitting order for {symbol}: {e}", exc_info=True)
+    except APIError as e:
+        status_code = APIErrorHandler.get_status_code(e)
         
-        # If the error is specifically about short selling, convert to a buy order
-        if "not allowed to short" in str(e).lower():
-            logger.warning(f"Short selling not allowed for {symbol}, attempting to submit buy order instead")
+        if status_code == 422:
+            # Validation errors are permanent, so fail fast instead of retrying
+            logger.error("Order for %s rejected (%s): %s", symbol, status_code, e)
+            return None
+            
+        logger.error("Error submitting order for %s: %s", symbol, e, exc_info=True)
+        
+        # Safety net for a stale position cache: if the error is specifically
+        # about short selling, convert to a buy order
+        if status_code == 403 and SHORT_SELL_RE.search(str(e)):
+            logger.warning("Short selling not allowed for %s, attempting to submit buy order instead", symbol)
+            get_position_cache(self).invalidate()
             try:
-                # Retry as a buy order
-                order = self.api.submit_order(
-                    symbol=symbol,
-                    qty=qty,
-                    side='buy',  # Convert to buy
-                    type=type,
-                    time_in_force=time_in_force
-                )
-                logger.info(f"Converted to buy order for {qty} shares of {symbol}")
+                order = _do_submit(self, symbol, qty, 'buy', type, time_in_force)
+                logger.info("Converted to buy order for %s shares of %s", qty, symbol)
                 return order
             except Exception as retry_e:
-                logger.error(f"Error submitting converted buy order for {symbol}: {retry_e}", exc_info=True)
+                logger.error("Error submitting converted buy order for %s: %s", symbol, retry_e, exc_info=True)
+        
+        return None
         
+    except Exception as e:
+        logger.error("Error submitting order for %s: %s", symbol, e, exc_info=True)
         return None
+
+def _get_order_workers(self):
+    """
+    Get the order submission workers for this wrapper, creating them on first use.
+    
+    Returns:
+        list: Single-threaded executors, one per worker slot
+    """
+    workers = getattr(self, '_order_workers', None)
+    if workers is None:
+        with _ORDER_WORKERS_LOCK:
+            workers = getattr(self, '_order_workers', None)
+            if workers is None:
+                workers = [
+                    ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"order-worker-{i}")
+                    for i in range(ORDER_WORKERS)
+                ]
+                self._order_workers = workers
+    return workers
+
+def submit_order_async(self, symbol, qty, side, type, time_in_force):
+    """
+    Queue an order with short selling protection and return without waiting.
+    
+    Orders for the same symbol go to the same single-threaded worker, so they
+    are submitted in the order they were queued.
+    
+    Args:
+        symbol (str): Symbol to trade
+        qty (int): Quantity to trade
+        side (str): 'buy' or 'sell'
+        type (str): 'market', 'limit', etc.
+        time_in_force (str): 'day', 'gtc', etc.
+        
+    Returns:
+        concurrent.futures.Future: Resolves to the Order object or None if error
+    """
+    workers = _get_order_workers(self)
+    worker = workers[hash(symbol) % len(workers)]
+    return worker.submit(self.submit_order_with_short_check, symbol, qty, side, type, time_in_force)
@@ -11,14 +11,303 @@ import json
 import requests
 from datetime import datetime, timedelta
 import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+import numpy as np
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# HTTP statuses where the request was not processed and is safe to retry
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+
+# Server-side failures that are only safe to retry for idempotent requests
+SERVER_ERROR_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+# Per-thread random generators, so fallback paths on many threads never share one
+_thread_local = threading.local()
+
+def _get_random():
+    """
+    Get this thread's random number generator, creating it on first use.
+    
+    Returns:
+        random.Random: Generator owned by the calling thread
+    """
+    rng = getattr(_thread_local, 'random', None)
+    if rng is None:
+        rng = _thread_local.random = random.Random()
+    return rng
+
+# Sentiment signals indexed by bucket + 1
+_SENTIMENT_SIGNALS = ('BEARISH', 'NEUTRAL', 'BULLISH')
+
+# Shared read-only result for fallback sentiment in the neutral band
+_NEUTRAL_SENTIMENT = MappingProxyType({
+    'sentiment_score': 0.0,
+    'signal': 'NEUTRAL',
+    'confidence': 0.5,
+    'source_detail': 'Finnhub (Sample Data)'
+})
+
+# Sample politicians
+_POLITICIANS = (
+    "Sen. John Smith",
+    "Sen. Maria Johnson",
+    "Sen. Robert Davis",
+    "Sen. Elizabeth Brown",
+    "Sen. Michael Wilson"
+)
+
+# Sample companies and tickers - REAL STOCKS under $40
+_COMPANIES = tuple(MappingProxyType(company) for company in (
+    {"company": "Ford Motor Company", "ticker": "F"},
+    {"company": "Siriusxm Holdings Inc", "ticker": "SIRI"},
+    {"company": "Nokia Corporation", "ticker": "NOK"},
+    {"company": "Banco Bradesco SA", "ticker": "BBD"},
+    {"company": "Vale SA", "ticker": "VALE"},
+    {"company": "Itau Unibanco Holding SA", "ticker": "ITUB"},
+    {"company": "Ericsson", "ticker": "ERIC"},
+    {"company": "AT&T Inc", "ticker": "T"},
+    {"company": "Petrobras", "ticker": "PBR"},
+    {"company": "Vodafone Group PLC", "ticker": "VOD"}
+))
+
+# Sample transaction types
+_BUY_TRANSACTIONS = ("Purchase", "Partial Purchase", "Buy")
+_SELL_TRANSACTIONS = ("Sale", "Partial Sale", "Sell")
+
+@dataclass
+class CongressTrade:
+    """
+    Sample Congress trade with fixed fields and no per-instance dict.
+    
+    Supports trade['ticker'], trade.get('ticker'), 'ticker' in trade and
+    iteration over the field names so it can be used wherever a trade
+    dictionary is read. Use to_dict() where a real dict is required, e.g.
+    for json.dumps().
+    """
+    
+    __slots__ = (
+        'date', 'politician', 'ticker', 'company', 'transaction_type', 'estimated_value',
+        'asset_type', 'signal', 'confidence', 'source', 'source_detail', 'is_sample_data'
+    )
+    
+    date: datetime
+    politician: str
+    ticker: str
+    company: str
+    transaction_type: str
+    estimated_value: int
+    asset_type: str
+    signal: str
+    confidence: float
+    source: str
+    source_detail: str
+    is_sample_data: bool
+    
+    def __getitem__(self, key):
+        """Get a field by name, like dict[key]."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+            
+    def __contains__(self, key):
+        """Check for a field name, like key in dict."""
+        return key in self.__slots__
+        
+    def __iter__(self):
+        """Iterate over the field names, like iter(dict)."""
+        return iter(self.__slots__)
+        
+    def __len__(self):
+        """Get the number of fields, like len(dict)."""
+        return len(self.__slots__)
+        
+    def get(self, key, default=None):
+        """
+        Get a field by name, like dict.get().
+        
+        Args:
+            key (str): Field name
+            default: Value returned when the field does not exist
+            
+        Returns:
+            object: Field value or default
+        """
+        return getattr(self, key, default)
+        
+    def keys(self):
+        """
+        Get the field names, like dict.keys().
+        
+        Returns:
+            list: Field names in declaration order
+        """
+        return list(self.__slots__)
+        
+    def to_dict(self):
+        """
+        Convert the trade to a plain dictionary.
+        
+        Returns:
+            dict: Trade fields keyed by name
+        """
+        return asdict(self)
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that keeps calls under an API rate limit.
+    
+    After a 429 response the refill rate is halved and then recovers gradually
+    back to the configured rate.
+    """
+    
+    def __init__(self, rate=200, per=60.0, recovery=0.1):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate (int): Number of calls allowed per period
+            per (float): Length of the period in seconds
+            recovery (float): Fraction of the full rate regained per period after a 429
+        """
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.per = float(per)
+        self.recovery = recovery
+        self.min_rate = max(1.0, self.max_rate / 10)
+        self._tokens = float(rate)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        
+    def _refill(self):
+        """Add tokens for the time elapsed since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last
+        self._last = now
+        
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + elapsed * self.max_rate * self.recovery / self.per)
+            
+        self._tokens = min(self.rate, self._tokens + elapsed * self.rate / self.per)
+        
+    def acquire(self, blocking=True):
+        """
+        Take one token, waiting for the bucket to refill if it is empty.
+        
+        Args:
+            blocking (bool): Wait for a token instead of returning immediately
+            
+        Returns:
+            float: 0.0 once a token is taken, or the seconds until one is available
+                when blocking is False and the bucket is empty
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return 0.0
+                wait = (1 - self._tokens) * self.per / self.rate
+                
+            if not blocking:
+                return wait
+                
+            time.sleep(wait)
+            
+    def penalize(self):
+        """Halve the refill rate after the server reports a rate limit."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, self.rate)
+
 class APIErrorHandler:
     """
     Class for handling API errors and providing fallbacks.
     """
     
+    @staticmethod
+    def get_status_code(error):
+        """
+        Get the HTTP status code carried by an API exception.
+        
+        Args:
+            error (Exception): Exception raised by an API client
+            
+        Returns:
+            int: HTTP status code or None if unavailable
+        """
+        status_code = getattr(error, 'status_code', None)
+        if status_code is None:
+            response = getattr(error, 'response', None)
+            status_code = getattr(response, 'status_code', None)
+        return status_code
+        
+    @staticmethod
+    def get_retry_after(error):
+        """
+        Get the Retry-After delay sent with an API exception.
+        
+        Args:
+            error (Exception): Exception raised by an API client
+            
+        Returns:
+            float: Seconds to wait or None if no usable header was sent
+        """
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return None
+            
+        try:
+            return max(0.0, float(headers.get('Retry-After')))
+        except (TypeError, ValueError):
+            return None
+            
+    @staticmethod
+    def retry_with_backoff(fn, max_retries=3, base=1.0, cap=30.0, jitter=0.5,
+                           retry_statuses=RETRYABLE_STATUS_CODES):
+        """
+        Call a function, retrying rate-limited or unavailable responses with backoff.
+        
+        The delay is min(cap, base * 2**attempt) scaled by a random jitter factor,
+        unless the server sent a Retry-After header, which is also capped. Any other error is raised
+        immediately. fn should not retry by itself (pooled Alpaca clients have
+        the SDK's retry loop turned off), or the attempts multiply.
+        
+        Args:
+            fn (callable): Function to call with no arguments
+            max_retries (int): Maximum number of retries after the first attempt
+            base (float): Base delay in seconds
+            cap (float): Maximum delay in seconds before jitter
+            jitter (float): Maximum fraction of the delay added at random
+            retry_statuses (frozenset): HTTP statuses that are retried
+            
+        Returns:
+            object: Return value of fn
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                return fn()
+            except Exception as e:
+                status_code = APIErrorHandler.get_status_code(e)
+                if status_code not in retry_statuses or attempt >= max_retries:
+                    raise
+                    
+                delay = APIErrorHandler.get_retry_after(e)
+                if delay is None:
+                    delay = min(cap, base * 2 ** attempt) * (1 + _get_random().random() * jitter)
+                else:
+                    # Never block the caller longer than cap, whatever the server asks
+                    delay = min(cap, delay)
+                    
+                logger.warning("API returned %s, retrying in %.1fs (attempt %d/%d)", status_code, delay, attempt + 1, max_retries)
+                time.sleep(delay)
+    
     @staticmethod
     def handle_finnhub_error(ticker, finnhub_key):
         """
@@ -29,28 +318,23 @@ class APIErrorHandler:
             finnhub_key (str): Finnhub API key
             
         Returns:
-            dict: Sentiment data for the ticker
+            dict: Sentiment data for the ticker; neutral results share one
+                read-only mapping, so copy it before modifying
         """
-        logger.warning(f"Using fallback sentiment data for {ticker}")
+        logger.warning("Using fallback sentiment data for %s", ticker)
         
         # Generate sample sentiment data
-        sentiment_score = random.uniform(-0.5, 0.5)
-        
-        # Convert to signal
-        if sentiment_score > 0.2:
-            signal = 'BULLISH'
-            confidence = min(0.7, sentiment_score + 0.3)  # Lower max confidence for sample data
-        elif sentiment_score < -0.2:
-            signal = 'BEARISH'
-            confidence = min(0.7, abs(sentiment_score) + 0.3)
-        else:
-            signal = 'NEUTRAL'
-            confidence = 0.5
+        sentiment_score = _get_random().uniform(-0.5, 0.5)
+        
+        # Convert to signal: bucket is -1 (bearish), 0 (neutral) or 1 (bullish)
+        bucket = (sentiment_score > 0.2) - (sentiment_score < -0.2)
+        if not bucket:
+            return _NEUTRAL_SENTIMENT
             
         return {
             'sentiment_score': sentiment_score,
-            'signal': signal,
-            'confidence': confidence,
+            'signal': _SENTIMENT_SIGNALS[bucket + 1],
+            'confidence': min(0.7, abs(sentiment_score) + 0.3),  # Lower max confidence for sample data
             'source_detail': 'Finnhub (Sample Data)'
         }
         
@@ -64,75 +348,135 @@ class APIErrorHandler:
             delay_hours (int): Hours to delay after filing before considering the trade
             
         Returns:
-            list: Sample Congress trade data
+            list: Sample Congress trades as CongressTrade objects
         """
         logger.warning("Using sample Congress trade data")
         
-        # Sample politicians
-        politicians = [
-            "Sen. John Smith",
-            "Sen. Maria Johnson",
-            "Sen. Robert Davis",
-            "Sen. Elizabeth Brown",
-            "Sen. Michael Wilson"
-        ]
-        
-        # Sample companies and tickers - REAL STOCKS under $40
-        companies = [
-            {"company": "Ford Motor Company", "ticker": "F"},
-            {"company": "Siriusxm Holdings Inc", "ticker": "SIRI"},
-            {"company": "Nokia Corporation", "ticker": "NOK"},
-            {"company": "Banco Bradesco SA", "ticker": "BBD"},
-            {"company": "Vale SA", "ticker": "VALE"},
-            {"company": "Itau Unibanco Holding SA", "ticker": "ITUB"},
-            {"company": "Ericsson", "ticker": "ERIC"},
-            {"company": "AT&T Inc", "ticker": "T"},
-            {"company": "Petrobras", "ticker": "PBR"},
-            {"company": "Vodafone Group PLC", "ticker": "VOD"}
-        ]
-        
-        # Sample transaction types
-        buy_transactions = ["Purchase", "Partial Purchase", "Buy"]
-        sell_transactions = ["Sale", "Partial Sale", "Sell"]
-          # Generate sample data
-        sample_trades = []
-        today = datetime.now()
+        sample_trades = list(APIErrorHandler.iter_sample_congress_trades(max_transaction_size, delay_hours))
         
-        for i in range(random.randint(10, 15)):
-            # Random date within the last month but not too recent
-            days_ago = random.randint(int(delay_hours // 24) + 1, 30)
-            trade_date = today - timedelta(days=days_ago)
-            
-            # Random company
-            company_data = random.choice(companies)
-            
-            # Random buy/sell with 60% buys
-            is_buy = random.random() < 0.6
-            transaction_type = random.choice(buy_transactions if is_buy else sell_transactions)
+        logger.info("Generated %d sample Congress trades", len(sample_trades))
+        return sample_trades
+        
+    @staticmethod
+    def iter_sample_congress_trades(max_transaction_size=1000000, delay_hours=24):
+        """
+        Lazily generate sample Congress trades for streaming consumers.
+        
+        Args:
+            max_transaction_size (float): Maximum transaction size to consider
+            delay_hours (int): Hours to delay after filing before considering the trade
             
-            # Random value between $1,000 and $max_transaction_size
-            value = random.randint(1000, int(max_transaction_size * 0.8))
+        Yields:
+            CongressTrade: Sample Congress trade
+        """
+        today = datetime.now()
+        draws = APIErrorHandler._draw_sample_congress_columns(max_transaction_size, delay_hours)
+        
+        # Convert to Python scalars so the trades stay plain JSON/SQLite-friendly values
+        for days, company, politician, buy, transaction, value, confidence in zip(
+            draws['days_ago'].tolist(),
+            draws['company_idx'].tolist(),
+            draws['politician_idx'].tolist(),
+            draws['is_buy'].tolist(),
+            draws['transaction_idx'].tolist(),
+            draws['values'].tolist(),
+            draws['confidences'].tolist()
+        ):
+            yield CongressTrade(
+                date=today - timedelta(days=days),
+                politician=_POLITICIANS[politician],
+                ticker=_COMPANIES[company]['ticker'],
+                company=_COMPANIES[company]['company'],
+                transaction_type=(_BUY_TRANSACTIONS if buy else _SELL_TRANSACTIONS)[transaction],
+                estimated_value=value,
+                asset_type="Stock",
+                # Signal based on transaction type
+                signal='BULLISH' if buy else 'BEARISH',
+                confidence=confidence,
+                source='congress',
+                source_detail='Senate Stock Watcher (Sample Data)',
+                is_sample_data=True
+            )
+                
+    @staticmethod
+    def sample_congress_trades_frame(max_transaction_size=1000000, delay_hours=24):
+        """
+        Generate sample Congress trades as a DataFrame with one column per field.
+        
+        Column filters such as df[df.signal == 'BULLISH'] run vectorized, and
+        df.to_dict('records') gives the same trade dictionaries as the list form.
+        
+        Args:
+            max_transaction_size (float): Maximum transaction size to consider
+            delay_hours (int): Hours to delay after filing before considering the trade
             
+        Returns:
+            pandas.DataFrame: Sample Congress trades
+        """
+        draws = APIErrorHandler._draw_sample_congress_columns(max_transaction_size, delay_hours)
+        is_buy = draws['is_buy']
+        n = len(is_buy)
+        
+        companies = draws['company_idx']
+        transactions = draws['transaction_idx']
+        
+        return pd.DataFrame({
+            'date': pd.Timestamp(datetime.now()) - pd.to_timedelta(draws['days_ago'], unit='D'),
+            'politician': np.array(_POLITICIANS, dtype=object)[draws['politician_idx']],
+            'ticker': np.array([c['ticker'] for c in _COMPANIES], dtype=object)[companies],
+            'company': np.array([c['company'] for c in _COMPANIES], dtype=object)[companies],
+            'transaction_type': np.where(
+                is_buy,
+                np.array(_BUY_TRANSACTIONS, dtype=object)[transactions],
+                np.array(_SELL_TRANSACTIONS, dtype=object)[transactions]
+            ),
+            'estimated_value': draws['values'],
+            'asset_type': np.full(n, "Stock", dtype=object),
             # Signal based on transaction type
-            signal = 'BULLISH' if is_buy else 'BEARISH'
-            confidence = min(0.8, value / max_transaction_size)
-            
-            trade = {
-                'date': trade_date,
-                'politician': random.choice(politicians),
-                'ticker': company_data['ticker'],
-                'company': company_data['company'],
-                'transaction_type': transaction_type,
-                'estimated_value': value,
-                'asset_type': "Stock",
-                'signal': signal,
-                'confidence': confidence,
-                'source': 'congress',
-                'source_detail': 'Senate Stock Watcher (Sample Data)',
-                'is_sample_data': True
-            }
-            
-            sample_trades.append(trade)
-            
-        logger.info(f"Generated {len(sample_trades)} sample Congress trades")
-        return sample_trades
+            'signal': np.where(is_buy, 'BULLISH', 'BEARISH').astype(object),
+            'confidence': draws['confidences'],
+            'source': np.full(n, 'congress', dtype=object),
+            'source_detail': np.full(n, 'Senate Stock Watcher (Sample Data)', dtype=object),
+            'is_sample_data': np.ones(n, dtype=bool)
+        })
+        
+    @staticmethod
+    def _draw_sample_congress_columns(max_transaction_size, delay_hours):
+        """
+        Draw the random columns for a batch of sample Congress trades.
+        
+        Args:
+            max_transaction_size (float): Maximum transaction size to consider
+            delay_hours (int): Hours to delay after filing before considering the trade
+            
+        Returns:
+            dict: NumPy arrays of equal length keyed by column name
+        """
+        # Generate sample data, drawing every random column in one vectorized pass
+        rng = np.random.default_rng()
+        n = int(rng.integers(10, 16))
+        
+        # Random date within the last month but not too recent
+        days_ago = rng.integers(int(delay_hours // 24) + 1, 31, n)
+        
+        # Random company and politician
+        company_idx = rng.integers(0, len(_COMPANIES), n)
+        politician_idx = rng.integers(0, len(_POLITICIANS), n)
+        
+        # Random buy/sell with 60% buys
+        is_buy = rng.random(n) < 0.6
+        transaction_idx = rng.integers(0, len(_BUY_TRANSACTIONS), n)
+        
+        # Random value between $1,000 and $max_transaction_size
+        values = rng.integers(1000, int(max_transaction_size * 0.8) + 1, n)
+        confidences = np.minimum(0.8, values / max_transaction_size)
+        
+        return {
+            'days_ago': days_ago,
+            'company_idx': company_idx,
+            'politician_idx': politician_idx,
+            'is_buy': is_buy,
+            'transaction_idx': transaction_idx,
+            'values': values,
+            'confidences': confidences
+        }
@@ -9,133 +9,812 @@ import logging
 import os
 import sqlite3
 import json
-from datetime import datetime, timedelta
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from collections import OrderedDict, namedtuple
+from datetime import date, datetime, timedelta
+from functools import lru_cache, wraps
+from operator import itemgetter
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Connection tuning applied to every connection
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA busy_timeout=5000"  # ms to wait on another writer before SQLITE_BUSY
+)
+
+# Prepared statements kept per connection; the module-level SQL constants
+# stay byte-identical between calls, so repeat saves and queries hit the cache
+CACHED_STATEMENTS = 256
+
+# Columns stored as EPOCH integer timestamps
+EPOCH_COLUMNS = frozenset({'date', 'created_at'})
+
+# Non-ISO date formats accepted for EPOCH columns (Senate filings use US dates)
+DATE_FORMATS = ('%m/%d/%Y', '%m/%d/%Y %H:%M:%S')
+
+# The background writer commits what has queued up after this many seconds,
+# or sooner once this many rows are waiting
+WRITE_BATCH_INTERVAL = 0.05
+WRITE_BATCH_ROWS = 5000
+
+# Seconds the background writer must sit idle after writing before it runs
+# maintenance()
+MAINTENANCE_IDLE_SECONDS = 30
+
+# Bumped whenever the table layout changes; see DatabaseManager._migrate
+SCHEMA_VERSION = 5
+
+# Table definitions; EPOCH date columns hold integer Unix timestamps and are
+# converted to and from datetime by the driver (see register_converter below).
+# created_at is filled in by SQLite when a row is inserted
+TABLE_SCHEMAS = {
+    'insider_trades': '''
+    CREATE TABLE IF NOT EXISTS insider_trades (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date EPOCH,
+        ticker TEXT,
+        company TEXT,
+        insider TEXT,
+        title TEXT,
+        trade_type TEXT,
+        price REAL,
+        quantity INTEGER,
+        value REAL,
+        ownership_change REAL,
+        sector TEXT,
+        signal TEXT,
+        source TEXT,
+        source_detail TEXT,
+        confidence REAL,
+        created_at EPOCH DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+    )
+    ''',
+    'congress_trades': '''
+    CREATE TABLE IF NOT EXISTS congress_trades (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date EPOCH,
+        ticker TEXT,
+        company TEXT,
+        politician TEXT,
+        transaction_type TEXT,
+        estimated_value REAL,
+        asset_type TEXT,
+        signal TEXT,
+        source TEXT,
+        source_detail TEXT,
+        confidence REAL,
+        created_at EPOCH DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+    )
+    ''',
+    'news': '''
+    CREATE TABLE IF NOT EXISTS news (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ticker TEXT,
+        title TEXT,
+        url TEXT,
+        source TEXT,
+        date EPOCH,
+        summary TEXT,
+        sentiment_score REAL,
+        signal TEXT,
+        confidence REAL,
+        source_detail TEXT,
+        created_at EPOCH DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+    )
+    ''',
+    'trades': '''
+    CREATE TABLE IF NOT EXISTS trades (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date EPOCH,
+        ticker TEXT,
+        action TEXT,
+        quantity INTEGER,
+        price REAL,
+        value REAL,
+        signal_id INTEGER,
+        signal_type TEXT,
+        confidence REAL,
+        created_at EPOCH DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+    )
+    '''
+}
+
+# Indices for the ticker/date range lookups
+TABLE_INDICES = (
+    'CREATE INDEX IF NOT EXISTS idx_insider_ticker_date ON insider_trades (ticker, date DESC)',
+    'CREATE INDEX IF NOT EXISTS idx_insider_date ON insider_trades (date)',
+    'CREATE INDEX IF NOT EXISTS idx_congress_ticker_date ON congress_trades (ticker, date DESC)',
+    'CREATE INDEX IF NOT EXISTS idx_congress_date ON congress_trades (date)',
+    'CREATE INDEX IF NOT EXISTS idx_news_ticker_date ON news (ticker, date DESC)',
+    'CREATE INDEX IF NOT EXISTS idx_news_date ON news (date)',
+    'CREATE INDEX IF NOT EXISTS idx_trades_ticker_date ON trades (ticker, date DESC)',
+    'CREATE INDEX IF NOT EXISTS idx_trades_date ON trades (date)',
+    # Partial index matching get_strong_news_signals, so it reads only
+    # non-neutral news in the date range
+    "CREATE INDEX IF NOT EXISTS idx_news_strong ON news (date DESC, confidence DESC) WHERE signal != 'NEUTRAL'"
+)
+
+# Natural keys of each scraped record; inserts skip rows already stored, so
+# re-scraping the same page does not grow the tables
+UNIQUE_KEYS = {
+    'insider_trades': ('ticker', 'date', 'insider', 'trade_type', 'quantity'),
+    'congress_trades': ('ticker', 'date', 'politician', 'transaction_type'),
+    'news': ('ticker', 'url', 'title', 'date')
+}
+
+UNIQUE_INDICES = tuple(
+    f"CREATE UNIQUE INDEX IF NOT EXISTS uq_{table} ON {table} ({', '.join(columns)})"
+    for table, columns in UNIQUE_KEYS.items()
+)
+
+# Plain (non-unique) indices per table, dropped and rebuilt around bulk loads
+_TABLE_INDEX_NAMES = {
+    table: tuple(
+        (index.split()[5], index) for index in TABLE_INDICES if f" ON {table} " in index
+    )
+    for table in TABLE_SCHEMAS
+}
+
+# Row counts per table and signal, kept current by triggers so get_statistics
+# does not scan the tables; tables without a signal column count under ''
+ROW_COUNTS_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS row_counts (
+    table_name TEXT NOT NULL,
+    signal TEXT NOT NULL,
+    n INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (table_name, signal)
+) WITHOUT ROWID
+'''
+
+# Signal expression counted for each table
+_COUNTED_SIGNALS = {
+    'insider_trades': "COALESCE({row}.signal, '')",
+    'congress_trades': "COALESCE({row}.signal, '')",
+    'news': "COALESCE({row}.signal, '')",
+    'trades': "''"
+}
+
+ROW_COUNT_TRIGGERS = tuple(
+    trigger
+    for table, signal in _COUNTED_SIGNALS.items()
+    for trigger in (
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_count_insert AFTER INSERT ON {table}
+        BEGIN
+            INSERT OR IGNORE INTO row_counts (table_name, signal) VALUES ('{table}', {signal.format(row='NEW')});
+            UPDATE row_counts SET n = n + 1 WHERE table_name = '{table}' AND signal = {signal.format(row='NEW')};
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_count_delete AFTER DELETE ON {table}
+        BEGIN
+            UPDATE row_counts SET n = n - 1 WHERE table_name = '{table}' AND signal = {signal.format(row='OLD')};
+        END
+        """
+    )
+)
+
+def _insert_sql(table, columns):
+    """
+    Build a parameterized INSERT statement for the given columns.
+    
+    Args:
+        table (str): Table name
+        columns (tuple): Column names in bind order
+        
+    Returns:
+        str: INSERT statement that skips rows violating a unique index
+    """
+    return f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+
+@lru_cache(maxsize=128)
+def _select_sql(table, filter_columns, order_by):
+    """
+    Build a parameterized SELECT for DatabaseManager.get_data.
+    
+    Args:
+        table (str): Table name
+        filter_columns (tuple): Columns compared for equality, in bind order
+        order_by (str): Validated ORDER BY term or None
+        
+    Returns:
+        str: SELECT statement ending in a bound LIMIT
+    """
+    query = f"SELECT * FROM {table}"
+    if filter_columns:
+        query += f" WHERE {' AND '.join(f'{column} = ?' for column in filter_columns)}"
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    return query + " LIMIT ?"
+
+def _to_epoch(value):
+    """
+    Convert a date to the Unix timestamp stored in an EPOCH date column.
+    
+    Datetimes are converted here rather than left to the registered adapter,
+    since sqlite3 only applies that to exact datetime instances and not to
+    subclasses such as pandas.Timestamp.
+    
+    Args:
+        value (datetime, date, str or int): Datetime, date, date string in ISO
+            or one of DATE_FORMATS, or timestamp
+        
+    Returns:
+        int: Seconds since the epoch, or None if the value is not a date
+    """
+    if isinstance(value, datetime):
+        try:
+            return int(value.timestamp())
+        except (ValueError, OverflowError, OSError):
+            # e.g. pandas.NaT
+            return None
+    if isinstance(value, date):
+        # A plain date is stored as local midnight
+        return int(datetime(value.year, value.month, value.day).timestamp())
+    if isinstance(value, (int, float)):
+        return int(value)
+    if not isinstance(value, str):
+        return None
+    try:
+        return _parse_iso_epoch(value)
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=4096)
+def _parse_iso_epoch(value):
+    """
+    Parse a date string to a Unix timestamp.
+    
+    Scraped trades share a small set of date strings, so results are cached.
+    
+    Args:
+        value (str): ISO formatted date (a trailing 'Z' is accepted) or one of
+            DATE_FORMATS
+        
+    Returns:
+        int: Seconds since the epoch
+        
+    Raises:
+        ValueError: If the string is not in a known date format
+    """
+    try:
+        return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+    except ValueError:
+        pass
+    for date_format in DATE_FORMATS:
+        try:
+            return int(datetime.strptime(value, date_format).timestamp())
+        except ValueError:
+            continue
+    raise ValueError(f"Unknown date format: {value!r}")
+
+def _dated_rows(records, row, defaults, kind):
+    """
+    Build parameter rows for a save_* batch, skipping records without a usable date.
+    
+    A row stored with a NULL date would never match the date-filtered reads
+    and never be removed by delete_old_data, so it is rejected instead.
+    
+    Args:
+        records (iterable): Record dictionaries
+        row (callable): itemgetter producing the parameter tuple
+        defaults (dict): Column defaults merged under each record
+        kind (str): Description used in the log message
+        
+    Returns:
+        list: Parameter tuples for executemany
+    """
+    rows = []
+    for record in records:
+        epoch = _to_epoch(record.get('date'))
+        if epoch is None:
+            logger.warning(f"Skipping {kind} for {record.get('ticker')} with unusable date {record.get('date')!r}")
+            continue
+        rows.append(row({**defaults, **record, 'date': epoch}))
+    return rows
+
+def _adapt_datetime(value):
+    """Bind a datetime as an integer Unix timestamp."""
+    return int(value.timestamp())
+
+def _convert_epoch(value):
+    """Read an EPOCH column value back as a local datetime."""
+    return datetime.fromtimestamp(int(value))
+
+sqlite3.register_adapter(datetime, _adapt_datetime)
+sqlite3.register_converter('EPOCH', _convert_epoch)
+
+def _from_epoch(value):
+    """
+    Convert a stored Unix timestamp back to a datetime.
+    
+    Args:
+        value (int): Seconds since the epoch
+        
+    Returns:
+        datetime: Local datetime, or value unchanged if it is not a timestamp
+    """
+    try:
+        return datetime.fromtimestamp(value)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return value
+
+def _cutoff(days):
+    """
+    Get the Unix timestamp for a number of days ago.
+    
+    Args:
+        days (int): Number of days to look back
+        
+    Returns:
+        int: Seconds since the epoch
+    """
+    return int((datetime.now() - timedelta(days=days)).timestamp())
+
+# Rows read per chunk when exporting a table to CSV
+EXPORT_CHUNK_SIZE = 50000
+
+# Seconds a get_* result is reused for; any write through this manager
+# invalidates it sooner, the TTL bounds staleness from other writers
+READ_CACHE_TTL = 5.0
+
+# Most get_* results kept at once; the least recently used go first
+READ_CACHE_SIZE = 256
+
+# Rows fetched per round trip by iter_recent_signals
+ITER_BATCH_SIZE = 1000
+
+# Rows removed per transaction by delete_old_data
+DELETE_CHUNK_SIZE = 10000
+
+# Column order, defaults and INSERT statements for the bulk save_* methods
+INSIDER_COLUMNS = (
+    'date', 'ticker', 'company', 'insider', 'title', 'trade_type', 'price', 'quantity',
+    'value', 'ownership_change', 'sector', 'signal', 'source', 'source_detail', 'confidence'
+)
+INSIDER_DEFAULTS = {
+    'ticker': '', 'company': '', 'insider': '', 'title': '', 'trade_type': '', 'price': 0.0, 'quantity': 0,
+    'value': 0.0, 'ownership_change': 0.0, 'sector': '', 'signal': 'NEUTRAL', 'source': 'insider',
+    'source_detail': '', 'confidence': 0.5
+}
+INSIDER_INSERT_SQL = _insert_sql('insider_trades', INSIDER_COLUMNS)
+
+CONGRESS_COLUMNS = (
+    'date', 'ticker', 'company', 'politician', 'transaction_type', 'estimated_value',
+    'asset_type', 'signal', 'source', 'source_detail', 'confidence'
+)
+CONGRESS_DEFAULTS = {
+    'ticker': '', 'company': '', 'politician': '', 'transaction_type': '', 'estimated_value': 0.0,
+    'asset_type': '', 'signal': 'NEUTRAL', 'source': 'congress', 'source_detail': '', 'confidence': 1.0
+}
+CONGRESS_INSERT_SQL = _insert_sql('congress_trades', CONGRESS_COLUMNS)
+
+NEWS_COLUMNS = (
+    'ticker', 'title', 'url', 'source', 'date', 'summary', 'sentiment_score',
+    'signal', 'confidence', 'source_detail'
+)
+NEWS_DEFAULTS = {
+    'title': '', 'url': '', 'source': '', 'summary': '', 'sentiment_score': 0.0,
+    'signal': 'NEUTRAL', 'confidence': 0.5, 'source_detail': ''
+}
+NEWS_INSERT_SQL = _insert_sql('news', NEWS_COLUMNS)
+
+# Bulk insert of a JSON array of NEWS_COLUMNS-ordered rows, unpacked inside SQLite
+NEWS_JSON_INSERT_SQL = "INSERT OR IGNORE INTO news ({}) SELECT {} FROM json_each(?)".format(
+    ', '.join(NEWS_COLUMNS),
+    ', '.join("json_extract(value, '$[%d]')" % i for i in range(len(NEWS_COLUMNS)))
+)
+
+TRADE_COLUMNS = (
+    'date', 'ticker', 'action', 'quantity', 'price', 'value', 'signal_id', 'signal_type', 'confidence'
+)
+TRADE_DEFAULTS = {
+    'ticker': '', 'action': '', 'quantity': 0, 'price': 0.0, 'value': 0.0,
+    'signal_id': None, 'signal_type': '', 'confidence': 0.5
+}
+TRADE_INSERT_SQL = _insert_sql('trades', TRADE_COLUMNS)
+
+_insider_row = itemgetter(*INSIDER_COLUMNS)
+_congress_row = itemgetter(*CONGRESS_COLUMNS)
+_news_row = itemgetter(*NEWS_COLUMNS)
+_trade_row = itemgetter(*TRADE_COLUMNS)
+
+class _RecordMixin:
+    """
+    Dict-style access for the namedtuple rows returned by the get_* methods.
+    
+    Rows are plain tuples, so no per-row dict is built, but row['ticker'],
+    row.get('ticker'), row.keys() and dict(row) keep working. Unlike a dict,
+    iterating a row and 'in' work on its values, as for any tuple.
+    """
+    
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        """Get a field by name, or by position for integer keys."""
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+        
+    def get(self, key, default=None):
+        """Get a field by name, like dict.get()."""
+        return getattr(self, key, default)
+        
+    def keys(self):
+        """Get the field names, like dict.keys()."""
+        return self._fields
+        
+    @classmethod
+    def _from_row(cls, cursor, row):
+        """Build a record from a database row, for use as a cursor row_factory."""
+        return cls._make(row)
+
+class InsiderRecord(_RecordMixin, namedtuple('InsiderRecord', ('id',) + INSIDER_COLUMNS + ('created_at',))):
+    """Insider trade row."""
+    __slots__ = ()
+
+class CongressRecord(_RecordMixin, namedtuple('CongressRecord', ('id',) + CONGRESS_COLUMNS + ('created_at',))):
+    """Congress trade row."""
+    __slots__ = ()
+
+class NewsRecord(_RecordMixin, namedtuple('NewsRecord', ('id',) + NEWS_COLUMNS + ('created_at',))):
+    """News item row."""
+    __slots__ = ()
+
+# Tables queried by get_all_signals_for_ticker, keyed by source name
+SIGNAL_SOURCES = {
+    'insider': ('insider_trades', InsiderRecord),
+    'congress': ('congress_trades', CongressRecord),
+    'news': ('news', NewsRecord)
+}
+
+# One UNION ALL over the signal tables; columns a table lacks are NULL-padded
+# and each row is tagged with its source in the first column
+_SIGNAL_COLUMNS = tuple(dict.fromkeys(c for _, record in SIGNAL_SOURCES.values() for c in record._fields))
+SIGNALS_FOR_TICKER_SQL = ' UNION ALL '.join(
+    f"SELECT '{source}' AS _src, "
+    + ', '.join(c if c in record._fields else f"NULL AS {c}" for c in _SIGNAL_COLUMNS)
+    + f" FROM {table} WHERE ticker = ? AND date >= ?"
+    for source, (table, record) in SIGNAL_SOURCES.items()
+) + ' ORDER BY date DESC'
+
+# Picks each source's own columns out of a fused row
+_SIGNAL_ROW_GETTERS = {
+    source: itemgetter(*(_SIGNAL_COLUMNS.index(c) + 1 for c in record._fields))
+    for source, (_, record) in SIGNAL_SOURCES.items()
+}
+
+# Explicit column lists in record field order, so reads do not depend on the
+# physical column order and wide columns are only read where a record has them
+_RECORD_COLUMNS = {table: ', '.join(record._fields) for table, record in SIGNAL_SOURCES.values()}
+
+RECENT_SQL = {
+    table: f"SELECT {columns} FROM {table} WHERE date >= ? ORDER BY date DESC"
+    for table, columns in _RECORD_COLUMNS.items()
+}
+
+# Tickers are bound as one JSON array, so a single prepared statement serves
+# ticker lists of any length
+RECENT_NEWS_FOR_TICKERS_SQL = (
+    f"SELECT {_RECORD_COLUMNS['news']} FROM news "
+    "WHERE date >= ? AND ticker IN (SELECT value FROM json_each(?)) ORDER BY date DESC"
+)
+
+STRONG_NEWS_SQL = (
+    f"SELECT {_RECORD_COLUMNS['news']} FROM news "
+    "WHERE date >= ? AND confidence >= ? AND signal != 'NEUTRAL' ORDER BY confidence DESC, date DESC"
+)
+
+def _hashable(value):
+    """Make a call argument hashable, turning lists such as tickers into tuples."""
+    return tuple(value) if isinstance(value, list) else value
+
+def _copy_result(result):
+    """Copy the containers of a cached get_* result so callers cannot alter the cache."""
+    if isinstance(result, dict):
+        return {key: list(value) for key, value in result.items()}
+    return list(result)
+
+class _FailedRead:
+    """
+    Fallback result of a get_* method whose query failed.
+    
+    _cached_read returns the wrapped result but does not cache it, so a
+    transient error is not repeated for READ_CACHE_TTL.
+    """
+    
+    __slots__ = ('result',)
+    
+    def __init__(self, result):
+        self.result = result
+
+def _cached_read(method):
+    """
+    Memoize a DatabaseManager get_* method until the next write or READ_CACHE_TTL.
+    
+    At most READ_CACHE_SIZE results are kept; expired entries are dropped when
+    they are next looked up or pushed out by newer ones.
+    
+    Args:
+        method (callable): Method returning a list, or a dict of lists, of records
+        
+    Returns:
+        callable: Wrapped method
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (
+            method.__name__,
+            tuple(_hashable(arg) for arg in args),
+            tuple(sorted((name, _hashable(arg)) for name, arg in kwargs.items()))
+        )
+        now = time.monotonic()
+        
+        with self._read_cache_lock:
+            cached = self._read_cache.pop(key, None)
+            if cached is not None and cached[0] == self._cache_version and now - cached[1] < READ_CACHE_TTL:
+                # Put it back as the most recently used entry
+                self._read_cache[key] = cached
+                return _copy_result(cached[2])
+                
+        # Take the version before reading, so a write that lands meanwhile
+        # leaves this entry already stale
+        version = self._cache_version
+        result = method(self, *args, **kwargs)
+        if isinstance(result, _FailedRead):
+            return result.result
+            
+        with self._read_cache_lock:
+            self._read_cache[key] = (version, now, result)
+            if len(self._read_cache) > READ_CACHE_SIZE:
+                self._read_cache.popitem(last=False)
+        return _copy_result(result)
+        
+    return wrapper
+
 class DatabaseManager:
     """
     Manager for SQLite database to cache insider, congress, and news data.
     """
     
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, background_writes=False):
         """
         Initialize the database manager.
         
         Args:
             db_path (str): Path to the SQLite database file
+            background_writes (bool): Queue save_* batches for a background
+                writer thread instead of committing them on the caller's thread
         """
         if not db_path:
             # Use default path in logs directory
             db_path = os.path.join('logs', 'alpatrader.db')
             
         # Ensure directory exists
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
             
         self.db_path = db_path
+        
+        # One long-lived connection per thread; sqlite3 connections must not
+        # be shared between threads while in use
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        
+        # SQLite allows a single writer; queueing writers here instead of in
+        # SQLite's busy handler avoids BUSY retries between our own threads
+        self._write_lock = threading.Lock()
+        
+        # Column names per table, filled in by _init_db
+        self._columns = {}
+        
+        # INSERT statements built by insert(), keyed by (table, sorted columns)
+        self._insert_sql_cache = {}
+        
+        # get_* results by call in least recently used order, invalidated by
+        # bumping _cache_version on commit
+        self._read_cache = OrderedDict()
+        self._read_cache_lock = threading.Lock()
+        self._cache_version = 0
+        
         self._init_db()
         
+        # Writes queued by save_* when background_writes is on. Each thread
+        # opening :memory: gets its own empty database, so it writes inline
+        self._write_queue = None
+        self._writer = None
+        if background_writes and self.db_path != ':memory:':
+            self._write_queue = queue.Queue()
+            self._writer = threading.Thread(target=self._drain_writes, name='db-writer', daemon=True)
+            self._writer.start()
+        
+    def _connect(self):
+        """
+        Open a connection to the database with the tuning PRAGMAs applied.
+        
+        Returns:
+            sqlite3.Connection: Database connection
+        """
+        # check_same_thread is off only so close() can release every
+        # thread's connection; each connection is still used by one thread
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            cached_statements=CACHED_STATEMENTS
+        )
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+        
+    def _get_conn(self):
+        """
+        Get the calling thread's connection, opening it on first use.
+        
+        Returns:
+            sqlite3.Connection: Database connection owned by this thread
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+        
+    def close(self):
+        """Commit queued writes, stop the background writer and close every connection."""
+        writer, self._writer = getattr(self, '_writer', None), None
+        if writer is not None:
+            self._write_queue.put(None)
+            writer.join()
+            self._write_queue = None
+            
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+                
+        self._local = threading.local()
+        
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+        
+    @contextmanager
+    def _transaction(self):
+        """
+        Run a block of writes as one transaction, rolling back on error.
+        
+        BEGIN IMMEDIATE takes the write lock up front, so the whole batch is
+        committed with a single fsync. Writers in this process are serialized
+        by _write_lock before they reach SQLite.
+        
+        Yields:
+            sqlite3.Cursor: Cursor inside the open transaction
+        """
+        conn = self._get_conn()
+        with self._write_lock:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                yield conn.cursor()
+                conn.commit()
+                self._cache_version += 1
+                with self._read_cache_lock:
+                    self._read_cache.clear()
+            except Exception:
+                conn.rollback()
+                raise
+            
     def _init_db(self):
         """Initialize the database with required tables."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Create insider trades table
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS insider_trades (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT,
-                ticker TEXT,
-                company TEXT,
-                insider TEXT,
-                title TEXT,
-                trade_type TEXT,
-                price REAL,
-                quantity INTEGER,
-                value REAL,
-                ownership_change REAL,
-                sector TEXT,
-                signal TEXT,
-                source TEXT,
-                source_detail TEXT,
-                confidence REAL,
-                created_at TEXT
-            )
-            ''')
-            
-            # Create congress trades table
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS congress_trades (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT,
-                ticker TEXT,
-                company TEXT,
-                politician TEXT,
-                transaction_type TEXT,
-                estimated_value REAL,
-                asset_type TEXT,
-                signal TEXT,
-                source TEXT,
-                source_detail TEXT,
-                confidence REAL,
-                created_at TEXT
-            )
-            ''')
-            
-            # Create news table
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS news (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                ticker TEXT,
-                title TEXT,
-                url TEXT,
-                source TEXT,
-                date TEXT,
-                summary TEXT,
-                sentiment_score REAL,
-                signal TEXT,
-                confidence REAL,
-                source_detail TEXT,
-                created_at TEXT
-            )
-            ''')
-            
-            # Create trades table (for executed trades)
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS trades (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT,
-                ticker TEXT,
-                action TEXT,
-                quantity INTEGER,
-                price REAL,
-                value REAL,
-                signal_id INTEGER,
-                signal_type TEXT,
-                confidence REAL,
-                created_at TEXT
-            )
-            ''')
+            conn = self._get_conn()
             
-            # Create indices for faster lookups
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_insider_ticker ON insider_trades (ticker)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_insider_date ON insider_trades (date)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_congress_ticker ON congress_trades (ticker)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_congress_date ON congress_trades (date)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_ticker ON news (ticker)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_date ON news (date)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_ticker ON trades (ticker)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_date ON trades (date)')
+            # WAL lets readers run alongside a writer and needs fewer fsyncs;
+            # it is persistent, so setting it once here covers every connection.
+            # In-memory databases cannot use WAL.
+            if self.db_path != ':memory:':
+                conn.execute("PRAGMA journal_mode=WAL")
             
-            conn.commit()
-            conn.close()
+            with self._transaction() as cursor:
+                cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+                existing_tables = {row[0] for row in cursor.fetchall()} & set(TABLE_SCHEMAS)
+                
+                # Bring tables created by an older version up to date
+                cursor.execute("PRAGMA user_version")
+                version = cursor.fetchone()[0]
+                if existing_tables and version < SCHEMA_VERSION:
+                    self._migrate(cursor, version, existing_tables)
+                
+                # Create tables and indices for faster lookups
+                for schema in TABLE_SCHEMAS.values():
+                    cursor.execute(schema)
+                for index in TABLE_INDICES + UNIQUE_INDICES:
+                    cursor.execute(index)
+                cursor.execute(ROW_COUNTS_SCHEMA)
+                for trigger in ROW_COUNT_TRIGGERS:
+                    cursor.execute(trigger)
+                    
+                cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                
+                # Cache column names so insert() does not query the schema every call
+                for table in TABLE_SCHEMAS:
+                    self._columns[table] = frozenset(self._get_table_columns(cursor, table))
+                    
+            # Refresh planner statistics for any indices that need them
+            conn.execute("PRAGMA optimize")
             
             logger.info(f"Database initialized at {self.db_path}")
             
         except Exception as e:
             logger.error(f"Error initializing database: {e}", exc_info=True)
+            
+    def _migrate(self, cursor, version, tables):
+        """
+        Upgrade tables written by an older schema version.
+        
+        Args:
+            cursor (sqlite3.Cursor): Cursor inside the open transaction
+            version (int): Schema version the database is at
+            tables (set): Existing tables to upgrade
+        """
+        if version < 4:
+            # Version 2 stored dates as integer Unix timestamps instead of ISO
+            # text and declared them EPOCH so the driver converts them; version
+            # 4 does the same for created_at and gives it a default. Column
+            # types cannot be altered in place, so each table is rebuilt;
+            # to_epoch() leaves already converted timestamps as they are.
+            cursor.connection.create_function('to_epoch', 1, _to_epoch)
+            for table in tables:
+                columns = self._get_table_columns(cursor, table)
+                select = ', '.join(f'to_epoch({c})' if c in EPOCH_COLUMNS else c for c in columns)
+                
+                cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+                cursor.execute(TABLE_SCHEMAS[table])
+                cursor.execute(f"INSERT INTO {table} ({', '.join(columns)}) SELECT {select} FROM {table}_old")
+                cursor.execute(f"DROP TABLE {table}_old")
+                
+            logger.info(f"Migrated {len(tables)} tables to integer timestamps")
+            
+        if version < 5:
+            # Version 5 adds unique indices on each table's natural key; drop
+            # the duplicates older versions stored so the indices can be built
+            for table in tables & UNIQUE_KEYS.keys():
+                cursor.execute(f"""
+                DELETE FROM {table} WHERE rowid NOT IN (
+                    SELECT MIN(rowid) FROM {table} GROUP BY {', '.join(UNIQUE_KEYS[table])}
+                )
+                """)
+                
+        # Rebuilt tables lose their counting triggers, so recount every upgrade
+        # from the migrated rows; the triggers are recreated by _init_db
+        cursor.execute(ROW_COUNTS_SCHEMA)
+        cursor.execute("DELETE FROM row_counts")
+        for table in tables:
+            signal = _COUNTED_SIGNALS[table].format(row=table)
+            cursor.execute(f"""
+            INSERT INTO row_counts (table_name, signal, n)
+            SELECT '{table}', {signal}, COUNT(*) FROM {table} GROUP BY 2
+            """)
     
     def insert(self, table, data):
         """
@@ -146,30 +825,46 @@ class DatabaseManager:
             data (dict): Data to insert
             
         Returns:
-            int: Row ID of inserted record or None if error
+            int: Row ID of inserted record or None if duplicate or error
         """
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+        # Only known tables may be named in the generated SQL
+        columns = self._columns.get(table)
+        if columns is None:
+            logger.error(f"Error inserting into {table}: unknown table")
+            return None
             
+        try:
             # Filter out keys that don't correspond to columns in the table
-            columns = self._get_table_columns(cursor, table)
-            filtered_data = {k: v for k, v in data.items() if k in columns}
-            
-            # Build SQL query
-            columns_str = ', '.join(filtered_data.keys())
-            placeholders = ', '.join(['?' for _ in filtered_data])
-            
-            query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
-            
-            # Execute query
-            cursor.execute(query, list(filtered_data.values()))
-            
-            # Get ID of inserted row
-            row_id = cursor.lastrowid
+            items = []
+            for k, v in data.items():
+                if k not in columns:
+                    continue
+                if k in EPOCH_COLUMNS:
+                    epoch = _to_epoch(v)
+                    if epoch is None:
+                        if k != 'created_at':
+                            logger.error(f"Error inserting into {table}: unusable {k} {v!r}")
+                            return None
+                        # Leave out a created_at that is not a date, so the
+                        # column keeps its DEFAULT instead of being set to NULL
+                        continue
+                    v = epoch
+                items.append((k, v))
+            items.sort()
+            key = (table, tuple(k for k, _ in items))
+            
+            # Build each column combination's SQL once
+            query = self._insert_sql_cache.get(key)
+            if query is None:
+                query = self._insert_sql_cache[key] = _insert_sql(table, key[1])
+                
+            values = [v for _, v in items]
             
-            conn.commit()
-            conn.close()
+            with self._transaction() as cursor:
+                cursor.execute(query, values)
+                
+                # Get ID of inserted row; nothing is inserted for a duplicate
+                row_id = cursor.lastrowid if cursor.rowcount else None
             
             return row_id
             
@@ -188,11 +883,12 @@ class DatabaseManager:
         Returns:
             list: Query results as a list of dictionaries
         """
+        conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            # Enable row factory to get results as dictionaries
-            conn.row_factory = sqlite3.Row
+            conn = self._get_conn()
             cursor = conn.cursor()
+            # Enable row factory to get results as dictionaries
+            cursor.row_factory = sqlite3.Row
             
             # Execute query
             if params:
@@ -203,14 +899,94 @@ class DatabaseManager:
             # Get results
             results = [dict(row) for row in cursor.fetchall()]
             
-            conn.close()
+            # The connection stays open for this thread, so a write must not
+            # leave its implicit transaction (and the database lock) behind
+            if conn.in_transaction:
+                conn.commit()
+                self._cache_version += 1
+                with self._read_cache_lock:
+                    self._read_cache.clear()
             
             return results
             
         except Exception as e:
+            if conn is not None and conn.in_transaction:
+                conn.rollback()
             logger.error(f"Error executing query: {e}", exc_info=True)
             return []
     
+    def _write(self, sql, rows, description):
+        """
+        Insert rows now, or queue them for the background writer.
+        
+        Args:
+            sql (str): INSERT statement
+            rows (list): Parameter tuples for executemany
+            description (str): What the rows are, for logging
+        """
+        if self._write_queue is not None:
+            self._write_queue.put((sql, rows, description))
+            return
+            
+        with self._transaction() as cursor:
+            cursor.executemany(sql, rows)
+            count = cursor.rowcount
+            
+        logger.info(f"Saved {count} {description} to database")
+        
+    def _drain_writes(self):
+        """Commit queued save_* batches, coalescing whatever arrives together into one transaction."""
+        stop = False
+        dirty = False
+        while not stop:
+            try:
+                item = self._write_queue.get(timeout=MAINTENANCE_IDLE_SECONDS if dirty else None)
+            except queue.Empty:
+                self.maintenance()
+                dirty = False
+                continue
+                
+            dirty = True
+            items = []
+            deadline = time.monotonic() + WRITE_BATCH_INTERVAL
+            pending_rows = 0
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                items.append(item)
+                pending_rows += len(item[1])
+                if pending_rows >= WRITE_BATCH_ROWS:
+                    break
+                try:
+                    item = self._write_queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                    
+            # One executemany per statement, all in a single transaction
+            batches = {}
+            for sql, rows, description in items:
+                batches.setdefault(sql, (description, []))[1].extend(rows)
+                
+            try:
+                if batches:
+                    saved = []
+                    with self._transaction() as cursor:
+                        for sql, (description, rows) in batches.items():
+                            cursor.executemany(sql, rows)
+                            saved.append(f"{cursor.rowcount} {description}")
+                    logger.info(f"Saved {', '.join(saved)} to database")
+            except Exception as e:
+                logger.error(f"Error saving queued writes: {e}", exc_info=True)
+            finally:
+                for _ in range(len(items) + stop):
+                    self._write_queue.task_done()
+                    
+    def flush(self):
+        """Block until every queued write has been committed."""
+        if self._write_queue is not None:
+            self._write_queue.join()
+    
     def save_insider_trades(self, trades):
         """
         Save insider trades to the database.
@@ -222,43 +998,9 @@ class DatabaseManager:
             return
             
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            now = datetime.now().isoformat()
+            rows = _dated_rows(trades, _insider_row, INSIDER_DEFAULTS, 'insider trade')
             
-            for trade in trades:
-                # Convert date object to string
-                date_str = trade['date'].isoformat() if isinstance(trade['date'], datetime) else trade['date']
-                
-                cursor.execute('''
-                INSERT INTO insider_trades 
-                (date, ticker, company, insider, title, trade_type, price, quantity, 
-                value, ownership_change, sector, signal, source, source_detail, confidence, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    date_str, 
-                    trade.get('ticker', ''), 
-                    trade.get('company', ''), 
-                    trade.get('insider', ''), 
-                    trade.get('title', ''), 
-                    trade.get('trade_type', ''), 
-                    trade.get('price', 0.0), 
-                    trade.get('quantity', 0), 
-                    trade.get('value', 0.0), 
-                    trade.get('ownership_change', 0.0), 
-                    trade.get('sector', ''), 
-                    trade.get('signal', 'NEUTRAL'), 
-                    trade.get('source', 'insider'), 
-                    trade.get('source_detail', ''), 
-                    trade.get('confidence', 0.5),
-                    now
-                ))
-            
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"Saved {len(trades)} insider trades to database")
+            self._write(INSIDER_INSERT_SQL, rows, 'insider trades')
             
         except Exception as e:
             logger.error(f"Error saving insider trades: {e}", exc_info=True)
@@ -274,42 +1016,86 @@ class DatabaseManager:
             return
             
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            rows = _dated_rows(trades, _congress_row, CONGRESS_DEFAULTS, 'Congress trade')
+            
+            self._write(CONGRESS_INSERT_SQL, rows, 'Congress trades')
             
-            now = datetime.now().isoformat()
+        except Exception as e:
+            logger.error(f"Error saving Congress trades: {e}", exc_info=True)
+    
+    def _bulk_load(self, table, sql, rows):
+        """
+        Insert a large batch with the table's plain indices dropped meanwhile.
+        
+        Building the indices once after the load is cheaper than updating
+        them row by row. The unique index stays in place so duplicates are
+        still skipped.
+        
+        Args:
+            table (str): Table name
+            sql (str): INSERT statement
+            rows (list): Parameter tuples for executemany
             
-            for trade in trades:
-                # Convert date object to string
-                date_str = trade['date'].isoformat() if isinstance(trade['date'], datetime) else trade['date']
+        Returns:
+            int: Number of rows inserted
+        """
+        with self._transaction() as cursor:
+            for name, _ in _TABLE_INDEX_NAMES[table]:
+                cursor.execute(f"DROP INDEX IF EXISTS {name}")
                 
-                cursor.execute('''
-                INSERT INTO congress_trades 
-                (date, ticker, company, politician, transaction_type, estimated_value, 
-                asset_type, signal, source, source_detail, confidence, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    date_str, 
-                    trade.get('ticker', ''), 
-                    trade.get('company', ''), 
-                    trade.get('politician', ''), 
-                    trade.get('transaction_type', ''), 
-                    trade.get('estimated_value', 0.0), 
-                    trade.get('asset_type', ''), 
-                    trade.get('signal', 'NEUTRAL'), 
-                    trade.get('source', 'congress'), 
-                    trade.get('source_detail', ''), 
-                    trade.get('confidence', 1.0),
-                    now
-                ))
-            
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"Saved {len(trades)} Congress trades to database")
+            cursor.executemany(sql, rows)
+            count = cursor.rowcount
+            
+            for _, index in _TABLE_INDEX_NAMES[table]:
+                cursor.execute(index)
+                
+        return count
+        
+    def bulk_load_insider_trades(self, trades):
+        """
+        Backfill a large history of insider trades.
+        
+        Runs in one transaction that drops and rebuilds the table's indices,
+        so it must not run while readers that rely on those indices are busy.
+        
+        Args:
+            trades (list): List of insider trade dictionaries
+        """
+        if not trades:
+            return
+            
+        try:
+            rows = _dated_rows(trades, _insider_row, INSIDER_DEFAULTS, 'insider trade')
+            
+            count = self._bulk_load('insider_trades', INSIDER_INSERT_SQL, rows)
+            
+            logger.info(f"Bulk loaded {count} insider trades to database")
             
         except Exception as e:
-            logger.error(f"Error saving Congress trades: {e}", exc_info=True)
+            logger.error(f"Error bulk loading insider trades: {e}", exc_info=True)
+    
+    def bulk_load_congress_trades(self, trades):
+        """
+        Backfill a large history of congress trades.
+        
+        Runs in one transaction that drops and rebuilds the table's indices,
+        so it must not run while readers that rely on those indices are busy.
+        
+        Args:
+            trades (list): List of congress trade dictionaries
+        """
+        if not trades:
+            return
+            
+        try:
+            rows = _dated_rows(trades, _congress_row, CONGRESS_DEFAULTS, 'Congress trade')
+            
+            count = self._bulk_load('congress_trades', CONGRESS_INSERT_SQL, rows)
+            
+            logger.info(f"Bulk loaded {count} Congress trades to database")
+            
+        except Exception as e:
+            logger.error(f"Error bulk loading Congress trades: {e}", exc_info=True)
     
     def save_news(self, news_by_ticker):
         """
@@ -322,41 +1108,14 @@ class DatabaseManager:
             return
             
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            now = datetime.now().isoformat()
-            count = 0
+            # Ship every row as one JSON array so SQLite unpacks and inserts
+            # them in a single statement instead of one bind per row
+            payload = json.dumps(_dated_rows(
+                ({**news, 'ticker': ticker} for ticker, news_items in news_by_ticker.items() for news in news_items),
+                _news_row, NEWS_DEFAULTS, 'news item'
+            ))
             
-            for ticker, news_items in news_by_ticker.items():
-                for news in news_items:
-                    # Convert date object to string
-                    date_str = news['date'].isoformat() if isinstance(news['date'], datetime) else news['date']
-                    
-                    cursor.execute('''
-                    INSERT INTO news 
-                    (ticker, title, url, source, date, summary, sentiment_score, 
-                    signal, confidence, source_detail, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        ticker, 
-                        news.get('title', ''), 
-                        news.get('url', ''), 
-                        news.get('source', ''), 
-                        date_str, 
-                        news.get('summary', ''), 
-                        news.get('sentiment_score', 0.0), 
-                        news.get('signal', 'NEUTRAL'), 
-                        news.get('confidence', 0.5),
-                        news.get('source_detail', ''),
-                        now
-                    ))
-                    count += 1
-            
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"Saved {count} news items to database")
+            self._write(NEWS_JSON_INSERT_SQL, [(payload,)], 'news items')
             
         except Exception as e:
             logger.error(f"Error saving news: {e}", exc_info=True)
@@ -366,42 +1125,29 @@ class DatabaseManager:
         Save executed trade to the database.
         
         Args:
-            trade (dict): Trade dictionary
+            trade (dict): Trade dictionary; 'total_value' and 'source' are
+                accepted for the value and signal_type columns
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            now = datetime.now().isoformat()
-            date_str = trade['date'].isoformat() if isinstance(trade['date'], datetime) else trade['date']
-            
-            cursor.execute('''
-            INSERT INTO trades 
-            (date, ticker, action, quantity, price, total_value, 
-            signal, confidence, source, source_detail, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                date_str, 
-                trade.get('ticker', ''), 
-                trade.get('action', ''), 
-                trade.get('quantity', 0), 
-                trade.get('price', 0.0), 
-                trade.get('total_value', 0.0), 
-                trade.get('signal', 'NEUTRAL'), 
-                trade.get('confidence', 0.5),
-                trade.get('source', ''),
-                trade.get('source_detail', ''),
-                now
-            ))
-            
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"Saved trade for {trade.get('ticker')} to database")
+            epoch = _to_epoch(trade.get('date'))
+            if epoch is None:
+                logger.error(f"Error saving trade for {trade.get('ticker')}: unusable date {trade.get('date')!r}")
+                return
+                
+            row = {**TRADE_DEFAULTS, **trade, 'date': epoch}
+            if 'total_value' in trade:
+                row['value'] = trade['total_value']
+            if 'source' in trade and 'signal_type' not in trade:
+                row['signal_type'] = trade['source']
+                
+            # One shared prepared statement; with background writes on, fills
+            # arriving together are committed in a single transaction
+            self._write(TRADE_INSERT_SQL, [_trade_row(row)], 'trades')
             
         except Exception as e:
             logger.error(f"Error saving trade: {e}", exc_info=True)
     
+    @_cached_read
     def get_recent_insider_trades(self, days=14):
         """
         Get recent insider trades from the database.
@@ -410,44 +1156,26 @@ class DatabaseManager:
             days (int): Number of days to look back
             
         Returns:
-            list: List of insider trades
+            list: InsiderRecord rows
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = self._get_conn()
             cursor = conn.cursor()
+            cursor.row_factory = InsiderRecord._from_row
             
             # Calculate cutoff date
-            cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+            cutoff_date = _cutoff(days)
             
-            cursor.execute('''
-            SELECT * FROM insider_trades 
-            WHERE date >= ? 
-            ORDER BY date DESC
-            ''', (cutoff_date,))
+            cursor.execute(RECENT_SQL['insider_trades'], (cutoff_date,))
             
-            rows = cursor.fetchall()
-            conn.close()
-            
-            # Convert to dictionaries
-            trades = []
-            for row in rows:
-                trade = dict(row)
-                
-                # Convert string dates back to datetime
-                try:
-                    trade['date'] = datetime.fromisoformat(trade['date'])
-                except ValueError:
-                    pass
-                    
-                trades.append(trade)
-            
-            return trades
+            # Rows come back as InsiderRecords; the driver converts the date
+            return cursor.fetchall()
             
         except Exception as e:
             logger.error(f"Error getting recent insider trades: {e}", exc_info=True)
-            return []
+            return _FailedRead([])
     
+    @_cached_read
     def get_recent_congress_trades(self, days=14):
         """
         Get recent congress trades from the database.
@@ -456,44 +1184,26 @@ class DatabaseManager:
             days (int): Number of days to look back
             
         Returns:
-            list: List of congress trades
+            list: CongressRecord rows
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = self._get_conn()
             cursor = conn.cursor()
+            cursor.row_factory = CongressRecord._from_row
             
             # Calculate cutoff date
-            cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+            cutoff_date = _cutoff(days)
             
-            cursor.execute('''
-            SELECT * FROM congress_trades 
-            WHERE date >= ? 
-            ORDER BY date DESC
-            ''', (cutoff_date,))
-            
-            rows = cursor.fetchall()
-            conn.close()
-            
-            # Convert to dictionaries
-            trades = []
-            for row in rows:
-                trade = dict(row)
-                
-                # Convert string dates back to datetime
-                try:
-                    trade['date'] = datetime.fromisoformat(trade['date'])
-                except ValueError:
-                    pass
-                    
-                trades.append(trade)
+            cursor.execute(RECENT_SQL['congress_trades'], (cutoff_date,))
             
-            return trades
+            # Rows come back as CongressRecords; the driver converts the date
+            return cursor.fetchall()
             
         except Exception as e:
             logger.error(f"Error getting recent congress trades: {e}", exc_info=True)
-            return []
+            return _FailedRead([])
     
+    @_cached_read
     def get_recent_news(self, tickers=None, days=7):
         """
         Get recent news from the database.
@@ -503,45 +1213,27 @@ class DatabaseManager:
             days (int): Number of days to look back
             
         Returns:
-            dict: Dictionary of news by ticker
+            dict: NewsRecord rows by ticker
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = self._get_conn()
             cursor = conn.cursor()
+            cursor.row_factory = NewsRecord._from_row
             
             # Calculate cutoff date
-            cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+            cutoff_date = _cutoff(days)
             
             if tickers:
-                placeholders = ','.join(['?'] * len(tickers))
-                cursor.execute(f'''
-                SELECT * FROM news 
-                WHERE date >= ? AND ticker IN ({placeholders})
-                ORDER BY date DESC
-                ''', [cutoff_date] + tickers)
+                cursor.execute(RECENT_NEWS_FOR_TICKERS_SQL, (cutoff_date, json.dumps(list(tickers))))
             else:
-                cursor.execute('''
-                SELECT * FROM news 
-                WHERE date >= ? 
-                ORDER BY date DESC
-                ''', (cutoff_date,))
+                cursor.execute(RECENT_SQL['news'], (cutoff_date,))
             
             rows = cursor.fetchall()
-            conn.close()
             
             # Group by ticker
             news_by_ticker = {}
-            for row in rows:
-                news = dict(row)
-                
-                # Convert string dates back to datetime
-                try:
-                    news['date'] = datetime.fromisoformat(news['date'])
-                except ValueError:
-                    pass
-                
-                ticker = news['ticker']
+            for news in rows:
+                ticker = news.ticker
                 if ticker not in news_by_ticker:
                     news_by_ticker[ticker] = []
                 news_by_ticker[ticker].append(news)
@@ -550,8 +1242,9 @@ class DatabaseManager:
             
         except Exception as e:
             logger.error(f"Error getting recent news: {e}", exc_info=True)
-            return {}
+            return _FailedRead({})
     
+    @_cached_read
     def get_strong_news_signals(self, threshold=0.7, days=3):
         """
         Get strong news signals with confidence above the threshold.
@@ -561,44 +1254,26 @@ class DatabaseManager:
             days (int): Number of days to look back
             
         Returns:
-            list: List of news signals
+            list: NewsRecord rows
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = self._get_conn()
             cursor = conn.cursor()
+            cursor.row_factory = NewsRecord._from_row
             
             # Calculate cutoff date
-            cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
-            
-            cursor.execute('''
-            SELECT * FROM news 
-            WHERE date >= ? AND confidence >= ? AND signal != 'NEUTRAL'
-            ORDER BY confidence DESC, date DESC
-            ''', (cutoff_date, threshold))
+            cutoff_date = _cutoff(days)
             
-            rows = cursor.fetchall()
-            conn.close()
-            
-            # Convert to dictionaries
-            signals = []
-            for row in rows:
-                signal = dict(row)
-                
-                # Convert string dates back to datetime
-                try:
-                    signal['date'] = datetime.fromisoformat(signal['date'])
-                except ValueError:
-                    pass
-                    
-                signals.append(signal)
+            cursor.execute(STRONG_NEWS_SQL, (cutoff_date, threshold))
             
-            return signals
+            # Rows come back as NewsRecords; the driver converts the date
+            return cursor.fetchall()
             
         except Exception as e:
             logger.error(f"Error getting strong news signals: {e}", exc_info=True)
-            return []
+            return _FailedRead([])
     
+    @_cached_read
     def get_all_signals_for_ticker(self, ticker, days=14):
         """
         Get all signals for a specific ticker from all sources.
@@ -608,67 +1283,85 @@ class DatabaseManager:
             days (int): Number of days to look back
             
         Returns:
-            dict: Dictionary of signals by source
+            dict: InsiderRecord, CongressRecord and NewsRecord rows by source
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = self._get_conn()
             cursor = conn.cursor()
             
             # Calculate cutoff date
-            cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
-            
-            # Get insider trades
-            cursor.execute('''
-            SELECT * FROM insider_trades 
-            WHERE ticker = ? AND date >= ?
-            ORDER BY date DESC
-            ''', (ticker, cutoff_date))
-            
-            insider_rows = cursor.fetchall()
-            
-            # Get congress trades
-            cursor.execute('''
-            SELECT * FROM congress_trades 
-            WHERE ticker = ? AND date >= ?
-            ORDER BY date DESC
-            ''', (ticker, cutoff_date))
-            
-            congress_rows = cursor.fetchall()
-            
-            # Get news
-            cursor.execute('''
-            SELECT * FROM news 
-            WHERE ticker = ? AND date >= ?
-            ORDER BY date DESC
-            ''', (ticker, cutoff_date))
-            
-            news_rows = cursor.fetchall()
-            
-            conn.close()
-            
-            # Convert to dictionaries
-            insider_trades = [dict(row) for row in insider_rows]
-            congress_trades = [dict(row) for row in congress_rows]
-            news_items = [dict(row) for row in news_rows]
-            
-            # Convert string dates back to datetime
-            for items in [insider_trades, congress_trades, news_items]:
-                for item in items:
-                    try:
-                        item['date'] = datetime.fromisoformat(item['date'])
-                    except ValueError:
-                        pass
-            
-            return {
-                'insider': insider_trades,
-                'congress': congress_trades,
-                'news': news_items
-            }
+            cutoff_date = _cutoff(days)
+            
+            # Fetch every source in one statement, then split rows by source tag
+            cursor.execute(SIGNALS_FOR_TICKER_SQL, (ticker, cutoff_date) * len(SIGNAL_SOURCES))
+            
+            signals = {source: [] for source in SIGNAL_SOURCES}
+            for row in cursor.fetchall():
+                source = row[0]
+                record = SIGNAL_SOURCES[source][1]
+                signals[source].append(record._from_row(cursor, _SIGNAL_ROW_GETTERS[source](row)))
+            
+            return signals
             
         except Exception as e:
             logger.error(f"Error getting signals for {ticker}: {e}", exc_info=True)
-            return {'insider': [], 'congress': [], 'news': []}
+            return _FailedRead({'insider': [], 'congress': [], 'news': []})
+    
+    def iter_recent_signals(self, source, days=14):
+        """
+        Iterate over recent signals from one source without loading them all.
+        
+        Rows are fetched ITER_BATCH_SIZE at a time, so memory use does not
+        grow with the size of the history.
+        
+        Args:
+            source (str): 'insider', 'congress' or 'news'
+            days (int): Number of days to look back
+            
+        Yields:
+            InsiderRecord, CongressRecord or NewsRecord: Rows newest first
+        """
+        table, record = SIGNAL_SOURCES[source]
+        
+        cursor = self._get_conn().cursor()
+        cursor.row_factory = record._from_row
+        try:
+            cursor.execute(RECENT_SQL[table], (_cutoff(days),))
+            while True:
+                batch = cursor.fetchmany(ITER_BATCH_SIZE)
+                if not batch:
+                    break
+                yield from batch
+        finally:
+            cursor.close()
+    
+    def get_recent_frame(self, source, days=7):
+        """
+        Get recent signals from one source as a DataFrame.
+        
+        For analytics over many rows; pandas builds the columns directly
+        instead of one record object per row.
+        
+        Args:
+            source (str): 'insider', 'congress' or 'news'
+            days (int): Number of days to look back
+            
+        Returns:
+            pandas.DataFrame: Rows newest first, empty if error
+        """
+        try:
+            table = SIGNAL_SOURCES[source][0]
+            
+            return pd.read_sql_query(
+                RECENT_SQL[table],
+                self._get_conn(),
+                params=(_cutoff(days),),
+                parse_dates=['date', 'created_at']
+            )
+            
+        except Exception as e:
+            logger.error(f"Error getting recent {source} frame: {e}", exc_info=True)
+            return pd.DataFrame()
     
     def get_data(self, table, filters=None, order_by=None, limit=None):
         """
@@ -684,26 +1377,29 @@ class DatabaseManager:
             list: Query results as a list of dictionaries
         """
         try:
-            query = f"SELECT * FROM {table}"
-            
-            params = []
-            
-            # Add WHERE clause if filters provided
-            if filters:
-                where_clauses = []
-                for column, value in filters.items():
-                    where_clauses.append(f"{column} = ?")
-                    params.append(value)
+            # Only known tables and columns may be named in the generated SQL
+            columns = self._columns.get(table)
+            if columns is None:
+                raise ValueError("unknown table")
+                
+            filter_items = sorted((filters or {}).items())
+            filter_columns = tuple(column for column, _ in filter_items)
+            unknown = set(filter_columns) - columns
+            if unknown:
+                raise ValueError(f"unknown filter columns {sorted(unknown)}")
                 
-                query += f" WHERE {' AND '.join(where_clauses)}"
-            
-            # Add ORDER BY clause if provided
             if order_by:
-                query += f" ORDER BY {order_by}"
+                order_parts = order_by.split()
+                if (not order_parts or len(order_parts) > 2 or order_parts[0] not in columns or
+                        (len(order_parts) == 2 and order_parts[1].upper() not in ('ASC', 'DESC'))):
+                    raise ValueError(f"invalid order_by {order_by!r}")
+                order_by = ' '.join(order_parts[:1] + [p.upper() for p in order_parts[1:]])
+            
+            query = _select_sql(table, filter_columns, order_by or None)
             
-            # Add LIMIT clause if provided
-            if limit:
-                query += f" LIMIT {limit}"
+            # A negative LIMIT means no limit, so every call binds one
+            params = [value for _, value in filter_items]
+            params.append(int(limit) if limit else -1)
             
             return self.execute_query(query, tuple(params))
             
@@ -722,25 +1418,54 @@ class DatabaseManager:
             bool: True if successful, False otherwise
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            cutoff_date = _cutoff(days)
+            deleted = 0
             
-            # Delete old data from all tables
+            # Delete old data from all tables in bounded chunks, each in its own
+            # transaction, so the WAL stays small and writers are not blocked long
             for table in ['insider_trades', 'congress_trades', 'news', 'trades']:
-                cursor.execute(f"""
-                DELETE FROM {table}
-                WHERE date < datetime('now', '-{days} day')
-                """)
+                while True:
+                    with self._transaction() as cursor:
+                        cursor.execute(f"""
+                        DELETE FROM {table}
+                        WHERE rowid IN (SELECT rowid FROM {table} WHERE date < ? LIMIT ?)
+                        """, (cutoff_date, DELETE_CHUNK_SIZE))
+                        count = cursor.rowcount
+                        
+                    deleted += count
+                    if count < DELETE_CHUNK_SIZE:
+                        break
+            
+            logger.info(f"Deleted {deleted} rows older than {days} days")
+            
+            return self.maintenance()
             
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"Deleted data older than {days} days")
+        except Exception as e:
+            logger.error(f"Error deleting old data: {e}", exc_info=True)
+            return False
             
+    def maintenance(self):
+        """
+        Checkpoint and truncate the WAL and refresh the query planner statistics.
+        
+        Run periodically, e.g. at end of day; the background writer also runs
+        it once writes have been idle for MAINTENANCE_IDLE_SECONDS.
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            conn = self._get_conn()
+            with self._write_lock:
+                # Fold the WAL back into the database file so readers do not
+                # have to search a growing log, then truncate it
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                conn.execute("PRAGMA optimize")
+                
             return True
             
         except Exception as e:
-            logger.error(f"Error deleting old data: {e}", exc_info=True)
+            logger.error(f"Error running database maintenance: {e}", exc_info=True)
             return False
     
     def _get_table_columns(self, cursor, table):
@@ -769,23 +1494,30 @@ class DatabaseManager:
             str: Path to the exported file or None if error
         """
         try:
+            # Only known tables may be named in the generated SQL
+            if table not in self._columns:
+                raise ValueError("unknown table")
+                
             if not output_path:
                 # Use default path in logs directory
                 os.makedirs('exports', exist_ok=True)
                 output_path = os.path.join('exports', f"{table}_{datetime.now().strftime('%Y%m%d')}.csv")
             
-            # Get data
-            data = self.get_data(table)
+            # Stream the table into the CSV a chunk at a time to keep memory flat
+            conn = self._get_conn()
+            count = 0
+            
+            for chunk in pd.read_sql_query(f"SELECT * FROM {table}", conn, chunksize=EXPORT_CHUNK_SIZE):
+                if chunk.empty:
+                    continue
+                chunk.to_csv(output_path, mode='a' if count else 'w', header=not count, index=False)
+                count += len(chunk)
             
-            if not data:
+            if not count:
                 logger.warning(f"No data found in {table}")
                 return None
             
-            # Convert to DataFrame and export
-            df = pd.DataFrame(data)
-            df.to_csv(output_path, index=False)
-            
-            logger.info(f"Exported {len(df)} rows from {table} to {output_path}")
+            logger.info(f"Exported {count} rows from {table} to {output_path}")
             
             return output_path
             
@@ -801,33 +1533,30 @@ class DatabaseManager:
             dict: Dictionary with statistics
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._get_conn()
             cursor = conn.cursor()
             
             stats = {}
             
-            # Get table counts
+            # Get table and signal counts from the trigger-maintained counters
+            signal_counts = {table: {} for table in _COUNTED_SIGNALS}
+            cursor.execute("SELECT table_name, signal, n FROM row_counts WHERE n > 0")
+            for table, signal, n in cursor.fetchall():
+                signal_counts[table][signal or None] = n
+                
             for table in ['insider_trades', 'congress_trades', 'news', 'trades']:
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                stats[f"{table}_count"] = cursor.fetchone()[0]
-            
-            # Get signal counts
-            cursor.execute("SELECT signal, COUNT(*) FROM insider_trades GROUP BY signal")
-            stats['insider_signals'] = dict(cursor.fetchall())
-            
-            cursor.execute("SELECT signal, COUNT(*) FROM congress_trades GROUP BY signal")
-            stats['congress_signals'] = dict(cursor.fetchall())
+                stats[f"{table}_count"] = sum(signal_counts[table].values())
             
-            cursor.execute("SELECT signal, COUNT(*) FROM news GROUP BY signal")
-            stats['news_signals'] = dict(cursor.fetchall())
+            stats['insider_signals'] = signal_counts['insider_trades']
+            stats['congress_signals'] = signal_counts['congress_trades']
+            stats['news_signals'] = signal_counts['news']
             
             # Get date ranges
             for table in ['insider_trades', 'congress_trades', 'news', 'trades']:
                 cursor.execute(f"SELECT MIN(date), MAX(date) FROM {table}")
                 min_date, max_date = cursor.fetchone()
-                stats[f"{table}_date_range"] = (min_date, max_date)
+                stats[f"{table}_date_range"] = (_from_epoch(min_date), _from_epoch(max_date))
             
-            conn.close()
             
             return stats
             
@@ -7,17 +7,16 @@ import os
 import sys
 import logging
 import configparser
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-import pandas as pd
-import time
+from functools import lru_cache
 
 # Add src to the path so we can import modules
 sys.path.append(os.path.join(os.path.dirname(__file__)))
 
-from src.data.insider_data import OpenInsiderScraper
-from src.data.congress_data import SenateScraper
-from src.data.news_data import NewsSentimentAnalyzer
-from src.utils.db_manager import DatabaseManager
+# pandas and the scraper modules are imported inside the functions that use
+# them, so loading this script stays cheap
 
 # Set up logging
 logging.basicConfig(
@@ -29,14 +28,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def load_config():
-    """Loads configuration from config file."""
+CONFIG_PATH = os.path.join("config", "config.ini")
+
+# Columns shown in the sample tables
+INSIDER_SAMPLE_COLS = ("date", "ticker", "insider", "title", "trade_type", "value", "signal", "confidence")
+CONGRESS_SAMPLE_COLS = ("date", "ticker", "politician", "transaction_type", "estimated_value", "signal")
+
+def load_config(path=CONFIG_PATH):
+    """Loads configuration from config file, parsing it again only after it changes."""
+    mtime = os.path.getmtime(path) if os.path.exists(path) else None
+    return _parse_config(path, mtime)
+
+@lru_cache(maxsize=4)
+def _parse_config(path, mtime):
+    """Parses a config file; mtime is part of the cache key so edits are picked up."""
     config = configparser.ConfigParser()
-    config.read(os.path.join("config", "config.ini"))
+    config.read(path)
     return config
 
+def summarize_trades(trades, count_cols, top=10):
+    """Counts the values of each column straight from the trades, most common first."""
+    # .get() works for trade dicts and for the CongressTrade sample records,
+    # and skips trades that lack a column; columns no trade has are left out
+    counts = {}
+    for col in count_cols:
+        values = Counter(trade.get(col) for trade in trades)
+        values.pop(None, None)
+        if values:
+            counts[col] = values.most_common(top)
+    return counts
+
+def format_counts(counts):
+    """Formats (value, count) pairs one per line."""
+    return [f"{value}: {count}" for value, count in counts]
+
+def sample_frame(trades, sample_cols, rows=5):
+    """Builds a DataFrame of just the first few trades, laid out in the displayed columns."""
+    import pandas as pd
+    return pd.DataFrame(trades[:rows]).reindex(columns=list(sample_cols))
+
 def test_insider_scraper():
     """Test the OpenInsider scraper."""
+    from src.data.insider_data import OpenInsiderScraper
+    from src.utils.db_manager import DatabaseManager
+    
+    buf = []
+    out = buf.append
+    
     logger.info("Testing OpenInsider scraper...")
     
     config = load_config()
@@ -57,28 +95,36 @@ def test_insider_scraper():
     if insider_trades:
         logger.info(f"Found {len(insider_trades)} insider trades")
         
-        # Convert to DataFrame for display
-        df = pd.DataFrame(insider_trades)
-        
         # Display summary
-        print("\n--- INSIDER TRADES SUMMARY ---")
-        print(f"Total trades: {len(df)}")
+        out("\n--- INSIDER TRADES SUMMARY ---")
+        out(f"Total trades: {len(insider_trades)}")
         
-        if not df.empty:
-            print("\nTrades by ticker:")
-            print(df["ticker"].value_counts().head(10))
-            
-            print("\nTrades by signal:")
-            print(df["signal"].value_counts())
-            
-            print("\nSample trades:")
-            sample_cols = ["date", "ticker", "insider", "title", "trade_type", "value", "signal", "confidence"]
-            print(df[sample_cols].head(5))
+        counts = summarize_trades(insider_trades, ["ticker", "signal"])
+        
+        out("\nTrades by ticker:")
+        buf.extend(format_counts(counts.get("ticker", ())))
+        
+        out("\nTrades by signal:")
+        buf.extend(format_counts(counts.get("signal", ())))
+        
+        out("\nSample trades:")
+        out(sample_frame(insider_trades, INSIDER_SAMPLE_COLS).to_string(index=False))
     else:
         logger.warning("No insider trades found")
+        
+    out("\n" + "=" * 80 + "\n")
+    
+    # Write the whole section at once, so concurrent tests do not interleave
+    sys.stdout.write("\n".join(buf) + "\n")
 
 def test_congress_scraper():
     """Test the Senate Stock Watcher scraper."""
+    from src.data.congress_data import SenateScraper
+    from src.utils.db_manager import DatabaseManager
+    
+    buf = []
+    out = buf.append
+    
     logger.info("Testing Senate Stock Watcher scraper...")
     
     config = load_config()
@@ -98,33 +144,39 @@ def test_congress_scraper():
     if congress_trades:
         logger.info(f"Found {len(congress_trades)} Congress trades")
         
-        # Convert to DataFrame for display
-        df = pd.DataFrame(congress_trades)
-        
         # Display summary
-        print("\n--- CONGRESS TRADES SUMMARY ---")
-        print(f"Total trades: {len(df)}")
+        out("\n--- CONGRESS TRADES SUMMARY ---")
+        out(f"Total trades: {len(congress_trades)}")
         
-        if not df.empty:
-            print("\nTrades by ticker:")
-            print(df["ticker"].value_counts().head(10))
-            
-            print("\nTrades by politician:")
-            if "politician" in df.columns:
-                print(df["politician"].value_counts().head(10))
-            
-            print("\nTrades by signal:")
-            print(df["signal"].value_counts())
-            
-            print("\nSample trades:")
-            sample_cols = ["date", "ticker", "politician", "transaction_type", "estimated_value", "signal"]
-            sample_cols = [col for col in sample_cols if col in df.columns]
-            print(df[sample_cols].head(5))
+        counts = summarize_trades(congress_trades, ["ticker", "politician", "signal"])
+        
+        out("\nTrades by ticker:")
+        buf.extend(format_counts(counts.get("ticker", ())))
+        
+        out("\nTrades by politician:")
+        buf.extend(format_counts(counts.get("politician", ())))
+        
+        out("\nTrades by signal:")
+        buf.extend(format_counts(counts.get("signal", ())))
+        
+        out("\nSample trades:")
+        out(sample_frame(congress_trades, CONGRESS_SAMPLE_COLS).to_string(index=False))
     else:
         logger.warning("No Congress trades found")
+        
+    out("\n" + "=" * 80 + "\n")
+    
+    # Write the whole section at once, so concurrent tests do not interleave
+    sys.stdout.write("\n".join(buf) + "\n")
 
 def test_news_analyzer():
     """Test the News Sentiment Analyzer."""
+    from src.data.news_data import NewsSentimentAnalyzer
+    from src.utils.db_manager import DatabaseManager
+    
+    buf = []
+    out = buf.append
+    
     logger.info("Testing News Sentiment Analyzer...")
     
     config = load_config()
@@ -142,53 +194,56 @@ def test_news_analyzer():
     test_tickers = ["AAPL", "MSFT", "GOOGL", "MARKET"]
     
     # Fetch news
-    print("\n--- FETCHING NEWS ---")
+    out("\n--- FETCHING NEWS ---")
+    news_items = news_analyzer.fetch_latest_news(test_tickers, days_back=2)
+    
     for ticker in test_tickers:
-        print(f"\nTesting news for {ticker}...")
-        news_items = news_analyzer.fetch_latest_news([ticker], days_back=2)
-        
-        if not news_items or ticker not in news_items:
-            print(f"No news found for {ticker}")
-            continue
-            
-        items = news_items[ticker]
-        print(f"Found {len(items)} news items for {ticker}")
+        out(f"\nTesting news for {ticker}...")
         
+        items = news_items.get(ticker) if news_items else None
         if not items:
+            out(f"No news found for {ticker}")
             continue
             
+        out(f"Found {len(items)} news items for {ticker}")
+        
         # Display sample
-        print("\nSample news items:")
+        out("\nSample news items:")
         for i, item in enumerate(items[:3]):  # Show up to 3 items
-            print(f"\nNews {i+1}:")
-            print(f"  Title: {item.get('title')}")
-            print(f"  Signal: {item.get('signal')}")
-            print(f"  Confidence: {item.get('confidence', 0):.2f}")
-            print(f"  Source: {item.get('source')}")
-            print(f"  Date: {item.get('date')}")
+            out(f"\nNews {i+1}:")
+            out(f"  Title: {item.get('title')}")
+            out(f"  Signal: {item.get('signal')}")
+            out(f"  Confidence: {item.get('confidence', 0):.2f}")
+            out(f"  Source: {item.get('source')}")
+            out(f"  Date: {item.get('date')}")
             
     # Test market mood analysis
-    print("\n--- MARKET MOOD ANALYSIS ---")
+    out("\n--- MARKET MOOD ANALYSIS ---")
     mood = news_analyzer.analyze_market_mood(days_back=2)
-    print(f"Market mood: {mood.get('mood')}")
-    print(f"Confidence: {mood.get('confidence', 0):.2f}")
-    print(f"Description: {mood.get('description')}")
+    out(f"Market mood: {mood.get('mood')}")
+    out(f"Confidence: {mood.get('confidence', 0):.2f}")
+    out(f"Description: {mood.get('description')}")
     
     # Test strong news signals
-    print("\n--- STRONG NEWS SIGNALS ---")
+    out("\n--- STRONG NEWS SIGNALS ---")
     strong_signals = news_analyzer.get_strong_news_signals(threshold=0.7)
     
     if strong_signals:
-        print(f"Found {len(strong_signals)} strong news signals")
+        out(f"Found {len(strong_signals)} strong news signals")
         
         for i, signal in enumerate(strong_signals[:5]):  # Show up to 5 signals
-            print(f"\nStrong signal {i+1}:")
-            print(f"  Ticker: {signal.get('ticker')}")
-            print(f"  Title: {signal.get('title')}")
-            print(f"  Signal: {signal.get('signal')}")
-            print(f"  Confidence: {signal.get('confidence', 0):.2f}")
+            out(f"\nStrong signal {i+1}:")
+            out(f"  Ticker: {signal.get('ticker')}")
+            out(f"  Title: {signal.get('title')}")
+            out(f"  Signal: {signal.get('signal')}")
+            out(f"  Confidence: {signal.get('confidence', 0):.2f}")
     else:
-        print("No strong news signals found")
+        out("No strong news signals found")
+        
+    out("\n" + "=" * 80 + "\n")
+    
+    # Write the whole section at once, so concurrent tests do not interleave
+    sys.stdout.write("\n".join(buf) + "\n")
 
 def main():
     """Run scraper tests."""
@@ -198,17 +253,25 @@ def main():
     print("\nThis test will check all data scrapers and show sample outputs.")
     print("Press Ctrl+C at any time to abort.\n")
     
-    # Test all scrapers
-    test_insider_scraper()
-    print("\n" + "=" * 80 + "\n")
-    time.sleep(1)  # Pause between tests
-    
-    test_congress_scraper()
-    print("\n" + "=" * 80 + "\n")
-    time.sleep(1)  # Pause between tests
-    
-    test_news_analyzer()
-    print("\n" + "=" * 80)
+    # The scrapers hit independent sites, so run them side by side and let
+    # their network waits overlap
+    tests = (test_insider_scraper, test_congress_scraper, test_news_analyzer)
+    failed = False
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {executor.submit(test): test.__name__ for test in tests}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                failed = True
+                logger.error("Error in %s: %s", futures[future], e)
+                # The traceback is only formatted when debug logging is on
+                logger.debug("Traceback for %s", futures[future], exc_info=True)
+            
+    if failed:
+        print("Tests completed with errors, see the log above.")
+        sys.exit(1)
+        
     print("Tests completed successfully!")
 
 if __name__ == "__main__":
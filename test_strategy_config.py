@@ -9,16 +9,42 @@ import sys
 import os
 import configparser
 from datetime import datetime
+from types import MappingProxyType
 
 # Add the project root directory to the path
 project_root = os.path.dirname(__file__)
 sys.path.append(project_root)
 
-# Try to import with the correct path
-from src.models.signal_processor import SignalProcessor
+# Strategy and signal names shared by the fixtures and the strategy sweep
+INVERSE, NORMAL, DISABLED = map(sys.intern, ('inverse', 'normal', 'disabled'))
+BUY, SELL = map(sys.intern, ('buy', 'sell'))
+
+# Trades fed to the signal processing test; read-only so a test cannot alter them
+_INSIDER_FIXTURE = (
+    MappingProxyType({
+        'ticker': 'AAPL',
+        'signal': BUY,
+        'confidence': 0.8,
+        'source': 'insider',
+        'insider': 'John Doe',
+        'title': 'CEO'
+    }),
+)
+
+_CONGRESS_FIXTURE = (
+    MappingProxyType({
+        'ticker': 'AAPL',
+        'signal': SELL,
+        'confidence': 0.7,
+        'source': 'congress',
+        'politician': 'Jane Smith'
+    }),
+)
 
 def test_strategy_configuration():
     """Test the strategy configuration loading and validation."""
+    # Imported here so loading this script does not pull in the model stack
+    from src.models.signal_processor import SignalProcessor
     
     # Load configuration
     config = configparser.ConfigParser()
@@ -32,10 +58,14 @@ def test_strategy_configuration():
     
     # Create mock scrapers and analyzer for testing
     class MockScraper:
+        __slots__ = ()
+        
         def fetch_latest_data(self):
             return []
     
     class MockAnalyzer:
+        __slots__ = ()
+        
         def fetch_latest_news(self, tickers):
             return {}
         def get_strong_news_signals(self, threshold):
@@ -56,38 +86,46 @@ def test_strategy_configuration():
         
         # Test different strategy configurations
         test_configurations = [
-            ('inverse', 'inverse'),
-            ('normal', 'normal'),
-            ('disabled', 'disabled'),
-            ('inverse', 'normal'),
-            ('normal', 'inverse'),
-            ('disabled', 'inverse'),
-            ('inverse', 'disabled')
+            (INVERSE, INVERSE),
+            (NORMAL, NORMAL),
+            (DISABLED, DISABLED),
+            (INVERSE, NORMAL),
+            (NORMAL, INVERSE),
+            (DISABLED, INVERSE),
+            (INVERSE, DISABLED)
         ]
         
         print("\n📋 Testing different strategy configurations:")
         
-        for insider_strat, congress_strat in test_configurations:
-            # Create a test config with the strategies
-            test_config = configparser.ConfigParser()
-            test_config.read_string(f"""
+        # Parse the test config once; only the two strategies change per run
+        test_config = configparser.ConfigParser()
+        test_config.read_string("""
 [trading]
-insider_strategy = {insider_strat}
-congress_strategy = {congress_strat}
 strong_news_multiplier = 2.0
 congress_only_multiplier = 1.0
 insider_only_multiplier = 0.5
 [filters]
 skip_fomc_blackout = True
-            """)
+        """)
+        
+        # One processor is reused; each run reloads just the strategy settings
+        test_processor = SignalProcessor(
+            config=test_config,
+            insider_scraper=MockScraper(),
+            congress_scraper=MockScraper(),
+            news_analyzer=MockAnalyzer()
+        )
+        
+        for insider_strat, congress_strat in test_configurations:
+            # Set the strategies under test
+            test_config.set('trading', 'insider_strategy', insider_strat)
+            test_config.set('trading', 'congress_strategy', congress_strat)
             
             # Test the processor with this config
-            test_processor = SignalProcessor(
-                config=test_config,
-                insider_scraper=MockScraper(),
-                congress_scraper=MockScraper(),
-                news_analyzer=MockAnalyzer()
-            )
+            test_processor._load_strategy_config(test_config)
+            if (test_processor.insider_strategy, test_processor.congress_strategy) != (insider_strat, congress_strat):
+                print(f"   ❌ Insider: {insider_strat.ljust(8)} | Congress: {congress_strat.ljust(8)} → Not applied")
+                return False
             
             print(f"   ✅ Insider: {insider_strat.ljust(8)} | Congress: {congress_strat.ljust(8)} → Working!")
         
@@ -99,6 +137,7 @@ skip_fomc_blackout = True
 
 def test_signal_processing_logic():
     """Test the signal processing logic with different strategies."""
+    from src.models.signal_processor import SignalProcessor
     
     print("\n🧪 Testing signal processing logic:")
     
@@ -117,6 +156,8 @@ skip_fomc_blackout = False
     
     # Create mock scrapers with test data
     class MockScraperWithData:
+        __slots__ = ('data',)
+        
         def __init__(self, data):
             self.data = data
             
@@ -124,39 +165,20 @@ skip_fomc_blackout = False
             return self.data
     
     class MockAnalyzerWithData:
+        __slots__ = ()
+        
         def fetch_latest_news(self, tickers):
             return {ticker: [] for ticker in tickers}
             
         def get_strong_news_signals(self, threshold):
             return []
     
-    # Test data
-    insider_data = [
-        {
-            'ticker': 'AAPL',
-            'signal': 'buy',
-            'confidence': 0.8,
-            'source': 'insider',
-            'insider': 'John Doe',
-            'title': 'CEO'
-        }
-    ]
-    
-    congress_data = [
-        {
-            'ticker': 'AAPL',
-            'signal': 'sell',
-            'confidence': 0.7,
-            'source': 'congress',
-            'politician': 'Jane Smith'
-        }
-    ]
-    
-    # Initialize processor with test data
+    # Initialize processor with test data; process_signals sorts the trade
+    # lists in place, so each scraper gets its own list
     processor = SignalProcessor(
         config=config,
-        insider_scraper=MockScraperWithData(insider_data),
-        congress_scraper=MockScraperWithData(congress_data),
+        insider_scraper=MockScraperWithData(list(_INSIDER_FIXTURE)),
+        congress_scraper=MockScraperWithData(list(_CONGRESS_FIXTURE)),
         news_analyzer=MockAnalyzerWithData()
     )
     